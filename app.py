@@ -1,3 +1,4 @@
+import html
 import streamlit as st
 import pandas as pd
 from scrapers.noticias import (
@@ -8,7 +9,12 @@ from scrapers.noticias import (
     fetch_crypto,
     fetch_test_g1
 )
-from utils import format_link, truncate_text
+from scrapers.crawler import crawl
+from scrapers.conteudo import add_contents
+from scrapers.seletores import selector_stats
+from scrapers.tendencias import trend_stats
+from utils import truncate_text, truncate_series, format_published_at, BRT
+from profiler import RerunProfiler, profiling_requested
 
 # Configuração da página
 st.set_page_config(
@@ -17,6 +23,11 @@ st.set_page_config(
     layout="wide"
 )
 
+# Modo de perfil (?profile=1 na URL ou DASHBOARD_PROFILE=1)
+query_params = st.query_params if hasattr(st, 'query_params') else st.experimental_get_query_params()
+perf = RerunProfiler(profiling_requested(query_params))
+perf.start()
+
 # Estilo CSS personalizado
 st.markdown("""
 <style>
@@ -39,6 +50,11 @@ st.markdown("""
         font-size: 0.85rem;
         font-style: italic;
     }
+    .news-excerpt {
+        color: #444;
+        font-size: 0.95rem;
+        margin-bottom: 0.5rem;
+    }
     .category-tech { border-left-color: #4361ee; }
     .category-business { border-left-color: #3a0ca3; }
     .category-astronomy { border-left-color: #7209b7; }
@@ -126,18 +142,45 @@ max_news = st.sidebar.slider(
     step=5
 )
 
+# Varredura profunda: segue a paginação das listagens
+deep_crawl = st.sidebar.checkbox(
+    "🕸️ Varredura profunda",
+    help="Percorre até 3 páginas de cada fonte (até 15 s por fonte)"
+)
+
+# Conteúdo completo dos artigos (texto, imagem e autor)
+load_contents = st.sidebar.checkbox(
+    "📄 Carregar conteúdo dos artigos",
+    help="Baixa e extrai o texto de cada notícia (guardado em cache no disco)"
+)
+
+# Janela das tendências do arquivo
+TREND_WINDOWS = {
+    "1 hora": 1,
+    "6 horas": 6,
+    "24 horas": 24,
+    "7 dias": 24 * 7,
+    "30 dias": 24 * 30
+}
+trend_window = st.sidebar.select_slider(
+    "Janela das tendências",
+    options=list(TREND_WINDOWS.keys()),
+    value="24 horas"
+)
+
 # Botão de atualização
 if st.sidebar.button("🔄 Atualizar Dados"):
-    st.experimental_rerun()
+    st.rerun()
 
 # Função para buscar notícias baseada na categoria
 @st.cache_data(ttl=300)  # Cache por 5 minutos
-def buscar_noticias(categoria: str) -> pd.DataFrame:
+def buscar_noticias(categoria: str, deep: bool = False) -> pd.DataFrame:
     """
     Busca notícias da categoria selecionada.
 
     Args:
         categoria (str): Categoria selecionada em inglês
+        deep (bool): Se True, percorre várias páginas de cada fonte
 
     Returns:
         pd.DataFrame: DataFrame com as notícias
@@ -152,6 +195,9 @@ def buscar_noticias(categoria: str) -> pd.DataFrame:
         "TestG1": fetch_test_g1  # Nova função de teste
     }
 
+    # Só executa em falha de cache
+    perf.mark("Falhas de cache (buscar_noticias)")
+
     # Debug: Imprimir informações úteis
     with st.sidebar.expander("📝 Informações de Debug"):
         st.write(f"Categoria selecionada: {categoria}")
@@ -159,24 +205,37 @@ def buscar_noticias(categoria: str) -> pd.DataFrame:
 
     try:
         # Buscar notícias da categoria
-        df = funcoes_categoria[categoria]()
+        if deep and categoria != "TestG1":
+            # A varredura roda dentro de um rerun bloqueante: orçamento bem menor
+            # que o da CLI (python -m scrapers.crawler), que faz a recuperação completa
+            df = crawl(category=categoria, max_pages=3, time_budget=15)
+        else:
+            df = funcoes_categoria[categoria]()
         if not df.empty:
             with st.sidebar.expander("📝 Informações de Debug"):
                 st.write(f"Número de notícias encontradas: {len(df)}")
+
+            # Atualiza as tendências do arquivo só com o que chegou nesta busca
+            trend_stats.ingest_dataframe(df)
+            trend_stats.save()
         return df
     except Exception as e:
         st.sidebar.error(f"Erro ao buscar notícias: {str(e)}")
         return pd.DataFrame()
 
 # Função para criar card HTML de notícia
-def create_news_card(title, link, source, category_class):
+def create_news_card(title, link, source, category_class, published_at="", excerpt="", author=""):
     """Cria um card HTML para exibir uma notícia."""
+    published_html = f" · {published_at}" if published_at else ""
+    author_html = f" · {author}" if author else ""
+    excerpt_html = f'<div class="news-excerpt">{excerpt}</div>' if excerpt else ""
     card_html = f"""
     <div class="news-card {category_class}">
         <div class="news-title">
             <a href="{link}" target="_blank">{title}</a>
         </div>
-        <div class="news-source">Fonte: {source}</div>
+        {excerpt_html}
+        <div class="news-source">Fonte: {source}{author_html}{published_html}</div>
     </div>
     """
     return card_html
@@ -185,7 +244,9 @@ def create_news_card(title, link, source, category_class):
 def create_news_list(news_df):
     """Cria uma lista simples de notícias."""
     for _, row in news_df.iterrows():
-        st.markdown(f"• [{row['title']}]({row['link']}) - _{row['source']}_")
+        published_at = format_published_at(row.get('published_at'))
+        published_md = f" ({published_at})" if published_at else ""
+        st.markdown(f"• [{row['title']}]({row['link']}) - _{row['source']}_{published_md}")
 
 # Conteúdo principal
 try:
@@ -193,71 +254,126 @@ try:
     st.subheader(f"{CATEGORY_ICONS.get(categoria_pt, '📰')} {categoria_pt}")
 
     with st.spinner(f"Buscando notícias de {categoria_pt}..."):
-        df = buscar_noticias(categoria)
+        with perf.section("Busca de notícias (cache/scraping)"):
+            df = buscar_noticias(categoria, deep_crawl)
 
         if df.empty:
             st.warning("Nenhuma notícia encontrada para a categoria selecionada.")
         else:
             # Limitar o número de notícias conforme definido no slider
+            # (as fontes já chegam intercaladas da mais recente para a mais antiga)
             df = df.head(max_news)
 
-            # Traduzir nomes das colunas (para uso na exibição em tabela)
-            df_display = df.rename(columns={
-                'title': 'título',
-                'source': 'fonte',
-                'category': 'categoria'
-            })
-
-            # Escolher o formato de exibição
-            if view_option == "Cards":
-                # Exibir em formato de cards
-                category_class = CATEGORY_CLASSES.get(categoria, "")
-
-                # Criar grid com 2 colunas
-                col1, col2 = st.columns(2)
-
-                # Distribuir as notícias entre as duas colunas
-                for i, (_, row) in enumerate(df.iterrows()):
-                    card = create_news_card(
-                        title=truncate_text(row['title'], 120),
-                        link=row['link'],
-                        source=row['source'],
-                        category_class=category_class
+            if load_contents:
+                with st.spinner("Carregando conteúdo dos artigos..."), perf.section("Conteúdo dos artigos"):
+                    df = add_contents(df)
+
+            with perf.section("Preparação dos dados (pandas)"):
+                # Traduzir nomes das colunas (para uso na exibição em tabela)
+                df_display = df.rename(columns={
+                    'title': 'título',
+                    'source': 'fonte',
+                    'category': 'categoria',
+                    'published_at': 'publicado em',
+                    'author': 'autor'
+                })
+                df_display = df_display.drop(columns=['text', 'image'], errors='ignore')
+                if 'publicado em' in df_display.columns:
+                    df_display['publicado em'] = df_display['publicado em'].dt.tz_convert(BRT)
+
+            with perf.section(f"Renderização ({view_option})"):
+                # Escolher o formato de exibição
+                if view_option == "Cards":
+                    # Exibir em formato de cards
+                    category_class = CATEGORY_CLASSES.get(categoria, "")
+
+                    # Criar grid com 2 colunas
+                    col1, col2 = st.columns(2)
+
+                    # Distribuir as notícias entre as duas colunas
+                    for i, (_, row) in enumerate(df.iterrows()):
+                        card = create_news_card(
+                            title=truncate_text(row['title'], 120),
+                            link=row['link'],
+                            source=row['source'],
+                            category_class=category_class,
+                            published_at=format_published_at(row.get('published_at')),
+                            excerpt=html.escape(truncate_text(row.get('text') or "", 240)),
+                            author=html.escape(row.get('author') or "")
+                        )
+
+                        # Alternar entre as colunas
+                        if i % 2 == 0:
+                            col1.markdown(card, unsafe_allow_html=True)
+                        else:
+                            col2.markdown(card, unsafe_allow_html=True)
+
+                elif view_option == "Tabela Compacta":
+                    # Truncar os títulos de uma vez, sem percorrer as linhas
+                    df_display['título'] = truncate_series(df_display['título'], 80)
+
+                    # Exibir como tabela interativa (dados enviados em Arrow, com links clicáveis)
+                    column_order = ['título', 'publicado em', 'fonte', 'categoria', 'autor', 'link']
+                    st.dataframe(
+                        df_display,
+                        column_order=[c for c in column_order if c in df_display.columns],
+                        column_config={
+                            'título': st.column_config.TextColumn('título', width='large'),
+                            'publicado em': st.column_config.DatetimeColumn('publicado em', format='DD/MM/YYYY HH:mm'),
+                            'link': st.column_config.LinkColumn('link')
+                        },
+                        hide_index=True,
+                        use_container_width=True
                     )
 
-                    # Alternar entre as colunas
-                    if i % 2 == 0:
-                        col1.markdown(card, unsafe_allow_html=True)
-                    else:
-                        col2.markdown(card, unsafe_allow_html=True)
+                else:  # Lista Simples
+                    create_news_list(df)
 
-            elif view_option == "Tabela Compacta":
-                # Criar links clicáveis
-                df_display['título'] = df.apply(
-                    lambda row: format_link(truncate_text(row['title'], 80), row['link']),
-                    axis=1
-                )
+            with perf.section("Estatísticas da barra lateral"):
+                # Exibir estatísticas
+                st.sidebar.markdown("---")
+                st.sidebar.markdown("### 📈 Estatísticas")
+                st.sidebar.markdown(f"**Total de artigos:** {len(df)}")
+                source_stats = df['source'].value_counts()
 
-                # Remover coluna de link pois já está embutida no título
-                df_display = df_display.drop('link', axis=1)
+                st.sidebar.markdown("#### 🔍 Fontes:")
+                for source, count in source_stats.items():
+                    st.sidebar.markdown(f"- **{source}**: {count} artigos")
 
-                # Exibir o dataframe com links clicáveis
-                st.write(df_display.to_html(escape=False), unsafe_allow_html=True)
+    with perf.section("Tendências do arquivo"):
+        # Agregados incrementais de todo o arquivo (não apenas das notícias exibidas)
+        hours = TREND_WINDOWS[trend_window]
+        st.sidebar.markdown(f"### 🔥 Tendências ({trend_window})")
 
-            else:  # Lista Simples
-                create_news_list(df)
+        top_terms = trend_stats.top_terms(hours)
+        if top_terms.empty:
+            st.sidebar.write("Ainda não há dados no arquivo para esta janela.")
+        else:
+            st.sidebar.markdown("#### 🏷️ Termos em alta:")
+            st.sidebar.dataframe(top_terms, hide_index=True)
 
-            # Exibir estatísticas
-            st.sidebar.markdown("---")
-            st.sidebar.markdown("### 📈 Estatísticas")
-            st.sidebar.markdown(f"**Total de artigos:** {len(df)}")
-            source_stats = df['source'].value_counts()
+            st.sidebar.markdown("#### 📰 Ritmo por fonte:")
+            st.sidebar.dataframe(trend_stats.source_rates(hours), hide_index=True)
 
-            st.sidebar.markdown("#### 🔍 Fontes:")
-            for source, count in source_stats.items():
-                st.sidebar.markdown(f"- **{source}**: {count} artigos")
+            st.sidebar.markdown("#### 📊 Volume por categoria:")
+            st.sidebar.bar_chart(trend_stats.category_volume(hours))
+
+    # Alertas de fontes que pararam de retornar artigos (provável mudança de layout)
+    for source in selector_stats.zero_yield_sources():
+        st.sidebar.warning(f"⚠️ {source} não retornou nenhum artigo na última busca.")
+
+    with perf.section("Saúde dos seletores"), st.sidebar.expander("🩺 Saúde dos seletores"):
+        selector_report = pd.DataFrame(selector_stats.report())
+        if selector_report.empty:
+            st.write("Nenhuma estatística registrada ainda.")
+        else:
+            st.dataframe(selector_report.sort_values(['source', 'group', 'hit_rate'], ascending=[True, True, False]))
 
 except Exception as e:
     st.error(f"Ocorreu um erro ao processar as notícias: {str(e)}")
     with st.expander("Ver detalhes do erro"):
         st.exception(e)
+
+# Painel de perfil (apenas no modo de perfil)
+perf.stop()
+perf.render(st.sidebar)
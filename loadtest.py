@@ -0,0 +1,222 @@
+"""
+Teste de carga do dashboard com várias sessões simultâneas.
+
+Cada sessão é uma instância do AppTest do Streamlit executando o app.py no mesmo
+processo (como em um único `streamlit run`), com os scrapers substituídos por
+dados fixos. Para cada nível de concorrência, mede a latência dos reruns,
+a vazão, a memória por sessão e quantas vezes os scrapers foram chamados
+(falhas de cache simultâneas indicam "stampede").
+
+Uso:
+    python loadtest.py --levels 1,2,4,8,16 --reruns 10 --scrape-delay 0.5
+"""
+import argparse
+import logging
+import os
+import random
+import resource
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+
+try:
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+except ImportError:  # AppTest existe a partir do Streamlit 1.28
+    AppTest = None
+
+import scrapers.noticias as noticias
+import scrapers.crawler as crawler
+import scrapers.conteudo as conteudo
+from scrapers.tendencias import trend_stats
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.py')
+
+CATEGORIES = ["Tecnologia", "Negócios", "Astronomia", "Economia", "Criptomoedas", "Teste (G1)"]
+VIEWS = ["Cards", "Tabela Compacta", "Lista Simples"]
+
+FETCHERS = {
+    'fetch_technology': ('Technology', ['Olhar Digital', 'Canaltech']),
+    'fetch_business': ('Business', ['Exame', 'CNN Brazil']),
+    'fetch_astronomy': ('Astronomy', ['Space.com', 'Galileu']),
+    'fetch_economy': ('Economy', ['CNN Brazil Economy', 'Exame Economy']),
+    'fetch_crypto': ('Cryptocurrency', ['Livecoins', 'Cointelegraph Brazil']),
+    'fetch_test_g1': ('Test', ['G1'])
+}
+
+WORDS = (
+    "mercado governo tecnologia inteligência artificial bitcoin selic inflação nasa "
+    "telescópio empresa startup lançamento dólar bolsa eleições satélite celular dados"
+).split()
+
+class ScraperStub:
+    """Substitui os scrapers por dados fixos, contando as chamadas."""
+
+    def __init__(self, articles: int, delay: float, seed: int):
+        self.articles = articles
+        self.delay = delay
+        self.seed = seed
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def fixture(self, category: str, sources) -> pd.DataFrame:
+        """Gera notícias determinísticas para uma categoria."""
+        rng = random.Random(f"{self.seed}-{category}")
+        now = datetime.now(timezone.utc)
+        articles = [{
+            'title': " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 14))).capitalize(),
+            'link': f"https://example.com/{category.lower()}/{i}",
+            'source': sources[i % len(sources)],
+            'category': category,
+            'published_at': now - timedelta(minutes=7 * i)
+        } for i in range(self.articles)]
+        return noticias.create_dataframe(articles)
+
+    def make_fetcher(self, category: str, sources):
+        def fetch() -> pd.DataFrame:
+            with self._lock:
+                self.calls += 1
+            time.sleep(self.delay)
+            return self.fixture(category, sources)
+        fetch.__name__ = f"stub_{category.lower()}"
+        return fetch
+
+    def install(self) -> None:
+        """Aplica os stubs nos módulos importados pelo app.py."""
+        for name, (category, sources) in FETCHERS.items():
+            setattr(noticias, name, self.make_fetcher(category, sources))
+        crawler.crawl = lambda category=None, **kwargs: self.fixture(category or 'Technology', ['Crawler'])
+        conteudo.add_contents = lambda df, **kwargs: df
+
+def current_rss_mb() -> float:
+    """Memória residente atual do processo, em MB."""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / 1024 ** 2
+    except (OSError, ValueError, AttributeError):
+        # Fora do Linux só há o pico de memória (KB no Linux, bytes no macOS)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+
+def run_session(session_id: int, reruns: int, timeout: float, seed: int, ready: threading.Barrier):
+    """Simula um usuário: abre o app e faz `reruns` interações aleatórias."""
+    rng = random.Random(f"{seed}-{session_id}")
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    latencies, errors = [], 0
+
+    started_at = time.perf_counter()
+    try:
+        at.run()
+        opened = True
+        latencies.append(time.perf_counter() - started_at)
+    except Exception:
+        # Ex.: timeout do AppTest com o app saturado; entra no relatório como erro
+        opened = False
+        errors += 1
+
+    try:
+        ready.wait()  # todas as sessões abertas antes de medir a memória
+    except threading.BrokenBarrierError:
+        errors += 1
+
+    if not opened:
+        # Sem a primeira execução não há widgets para interagir
+        return latencies, errors
+
+    for _ in range(reruns):
+        action = rng.choice(['category', 'view', 'slider'])
+        if action == 'category':
+            at.sidebar.selectbox[0].set_value(rng.choice(CATEGORIES))
+        elif action == 'view':
+            at.sidebar.radio[0].set_value(rng.choice(VIEWS))
+        else:
+            at.sidebar.slider[0].set_value(rng.choice([5, 15, 30, 50]))
+
+        started_at = time.perf_counter()
+        try:
+            at.run()
+        except Exception:
+            errors += 1
+            continue
+        latencies.append(time.perf_counter() - started_at)
+        errors += len(at.exception)
+
+    return latencies, errors
+
+def run_level(sessions: int, reruns: int, timeout: float, seed: int, stub: ScraperStub) -> dict:
+    """Executa um nível de concorrência com o cache zerado."""
+    st.cache_data.clear()
+    stub.calls = 0
+    baseline_mb = current_rss_mb()
+
+    ready = threading.Barrier(sessions + 1)
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as executor:
+        futures = [executor.submit(run_session, i, reruns, timeout, seed, ready) for i in range(sessions)]
+        try:
+            ready.wait()
+            memory_mb = (current_rss_mb() - baseline_mb) / sessions
+        except threading.BrokenBarrierError:
+            memory_mb = float('nan')
+        results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - started_at
+
+    latencies = pd.Series([latency for session, _ in results for latency in session]) * 1000
+    return {
+        'sessões': sessions,
+        'reruns': len(latencies),
+        'p50 (ms)': latencies.quantile(0.50),
+        'p90 (ms)': latencies.quantile(0.90),
+        'p99 (ms)': latencies.quantile(0.99),
+        'máx (ms)': latencies.max(),
+        'reruns/s': len(latencies) / elapsed,
+        'MB/sessão': memory_mb,
+        'chamadas aos scrapers': stub.calls,
+        'erros': sum(errors for _, errors in results)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de carga do dashboard de notícias.")
+    parser.add_argument('--levels', default='1,2,4,8,16', help="Níveis de concorrência (sessões simultâneas)")
+    parser.add_argument('--reruns', type=int, default=10, help="Interações por sessão")
+    parser.add_argument('--articles', type=int, default=200, help="Notícias por categoria nos dados fixos")
+    parser.add_argument('--scrape-delay', type=float, default=0.0, help="Latência simulada de cada scraper (s)")
+    parser.add_argument('--timeout', type=float, default=60, help="Timeout de cada rerun (s)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--csv', help="Grava o relatório neste arquivo CSV")
+    args = parser.parse_args()
+
+    if AppTest is None:
+        sys.exit("O teste de carga requer streamlit>=1.28 (streamlit.testing.v1.AppTest).")
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    # Os agregados de tendências do teste não devem poluir o arquivo real
+    trend_stats.path = os.path.join(tempfile.mkdtemp(), 'tendencias.json')
+
+    stub = ScraperStub(args.articles, args.scrape_delay, args.seed)
+    stub.install()
+
+    # Uma sessão de aquecimento importa o app e as bibliotecas antes da primeira
+    # medição, para que esse custo fixo não entre na memória por sessão
+    print("Aquecendo (sessão descartada)...", flush=True)
+    run_session(-1, 0, args.timeout, args.seed, threading.Barrier(1))
+
+    rows = []
+    for level in (int(value) for value in args.levels.split(',')):
+        print(f"Executando {level} sessão(ões) simultânea(s)...", flush=True)
+        rows.append(run_level(level, args.reruns, args.timeout, args.seed, stub))
+
+    report = pd.DataFrame(rows).round(1)
+    print(report.to_string(index=False))
+    if args.csv:
+        report.to_csv(args.csv, index=False)
+
+if __name__ == '__main__':
+    main()
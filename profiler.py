@@ -0,0 +1,209 @@
+import cProfile
+import io
+import os
+import pstats
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+
+import pandas as pd
+
+try:
+    from pyinstrument import Profiler as SamplingProfiler
+except ImportError:  # pyinstrument está no requirements.txt; sem ele usamos o cProfile
+    SamplingProfiler = None
+
+# Diretório onde os perfis brutos de cada execução são gravados
+PROFILE_DIR = os.path.join('data', 'perfis')
+
+# Pacotes usados para atribuir o tempo de CPU a cada camada do dashboard
+LAYERS = [
+    ('Streamlit', ('streamlit', 'tornado', 'pyarrow')),
+    ('pandas', ('pandas', 'numpy')),
+    ('Scraping', ('scrapers', 'requests', 'urllib3', 'bs4', 'lxml', 'soupsieve', 'http', 'ssl', 'socket')),
+]
+
+def profiling_requested(query_params) -> bool:
+    """
+    Indica se o modo de perfil foi pedido (?profile=1 na URL ou DASHBOARD_PROFILE=1).
+
+    Args:
+        query_params: Parâmetros da URL (valores simples ou listas)
+
+    Returns:
+        bool: True se o perfil deve ser ativado
+    """
+    value = query_params.get('profile', os.getenv('DASHBOARD_PROFILE', ''))
+    if isinstance(value, list):
+        value = value[0] if value else ''
+    return str(value).lower() in ('1', 'true', 'sim', 'yes', 'on')
+
+def classify_path(path: str) -> str:
+    """Classifica um arquivo de código em uma das camadas de LAYERS."""
+    parts = path.replace('\\', '/').split('/')
+    for layer, packages in LAYERS:
+        if any(package in parts or f"{package}.py" in parts for package in packages):
+            return layer
+    return 'Aplicação/outros'
+
+def _caller_path(stats: dict, function: tuple) -> str:
+    """Arquivo de uma função do cProfile, subindo pelos chamadores das funções embutidas."""
+    visited = set()
+    while function[0] == '~' and function not in visited and function in stats:
+        visited.add(function)
+        callers = stats[function][4]
+        if not callers:
+            break
+        # Segue o chamador responsável pela maior parte do tempo
+        function = max(callers, key=lambda caller: callers[caller][2])
+    return function[0]
+
+class RerunProfiler:
+    """
+    Mede uma execução (rerun) do dashboard.
+
+    Combina cronômetros por seção do script com um profiler de amostragem
+    (pyinstrument, ou cProfile se ele não estiver instalado). Quando desativado,
+    todos os métodos são operações vazias.
+    """
+
+    # Profiler ativo por thread; um rerun interrompido pelo Streamlit não chega a
+    # chamar stop(), então o próximo start() na mesma thread encerra o anterior
+    _running = {}
+
+    def __init__(self, enabled: bool, output_dir: str = PROFILE_DIR):
+        self.enabled = enabled
+        self.output_dir = output_dir
+        self.sections = []
+        self.events = defaultdict(int)
+        self._profiler = None
+        self._started_at = None
+        self.total = 0.0
+
+    def start(self) -> None:
+        """Inicia a medição da execução."""
+        if not self.enabled:
+            return
+        stale = self._running.pop(threading.get_ident(), None)
+        if stale is not None:
+            stale.stop()
+
+        self._profiler = SamplingProfiler(interval=0.001) if SamplingProfiler else cProfile.Profile()
+        self._running[threading.get_ident()] = self
+        self._started_at = time.perf_counter()
+        if SamplingProfiler:
+            self._profiler.start()
+        else:
+            self._profiler.enable()
+
+    def stop(self) -> None:
+        """Encerra a medição da execução."""
+        if not self.enabled or self._profiler is None or self._started_at is None:
+            return
+        self._running.pop(threading.get_ident(), None)
+        if SamplingProfiler:
+            self._profiler.stop()
+        else:
+            self._profiler.disable()
+        self.total = time.perf_counter() - self._started_at
+        self._started_at = None
+
+    @contextmanager
+    def section(self, name: str):
+        """Cronometra uma seção do script."""
+        if not self.enabled:
+            yield
+            return
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.sections.append((name, time.perf_counter() - started_at))
+
+    def mark(self, event: str) -> None:
+        """Conta um evento da execução (ex.: falha de cache)."""
+        if self.enabled:
+            self.events[event] += 1
+
+    def section_table(self) -> pd.DataFrame:
+        """Tempo gasto em cada seção, em milissegundos."""
+        totals = defaultdict(float)
+        for name, elapsed in self.sections:
+            totals[name] += elapsed
+        rows = [{'seção': name, 'ms': elapsed * 1000} for name, elapsed in totals.items()]
+        measured = sum(totals.values())
+        rows.append({'seção': 'Fora das seções', 'ms': max(self.total - measured, 0) * 1000})
+        rows.append({'seção': 'Total', 'ms': self.total * 1000})
+        df = pd.DataFrame(rows)
+        df['%'] = df['ms'] / (self.total * 1000 or 1) * 100
+        return df.round(1)
+
+    def layer_table(self) -> pd.DataFrame:
+        """Tempo próprio de CPU agrupado por camada (Streamlit, pandas, scraping)."""
+        totals = defaultdict(float)
+        if SamplingProfiler:
+            root = self._profiler.last_session.root_frame() if self._profiler.last_session else None
+            stack = [(root, '')] if root else []
+            while stack:
+                frame, parent_path = stack.pop()
+                # Frames sintéticos ("[self]") herdam o arquivo do frame pai
+                path = frame.file_path or parent_path
+                children = frame.children
+                self_time = frame.time - sum(child.time for child in children)
+                totals[classify_path(path)] += max(self_time, 0)
+                stack.extend((child, path) for child in children)
+        else:
+            stats = pstats.Stats(self._profiler).stats
+            for function, (_, _, self_time, _, callers) in stats.items():
+                if function[0] != '~':
+                    totals[classify_path(function[0])] += self_time
+                    continue
+                # Funções embutidas (time.sleep, leitura de socket...) não têm arquivo:
+                # o tempo vai para a camada de quem as chamou, na proporção de cada chamador
+                for caller, (_, _, caller_time, _) in callers.items():
+                    totals[classify_path(_caller_path(stats, caller))] += caller_time
+
+        df = pd.DataFrame([{'camada': layer, 'ms': seconds * 1000} for layer, seconds in totals.items()])
+        if df.empty:
+            return df
+        df['%'] = df['ms'] / df['ms'].sum() * 100
+        return df.sort_values('ms', ascending=False).round(1)
+
+    def flame_summary(self) -> str:
+        """Resumo textual da árvore de chamadas (ou das funções mais caras no cProfile)."""
+        if SamplingProfiler:
+            return self._profiler.output_text(unicode=True, color=False, show_all=False)
+        stream = io.StringIO()
+        pstats.Stats(self._profiler, stream=stream).sort_stats('cumulative').print_stats(30)
+        return stream.getvalue()
+
+    def dump(self) -> str:
+        """Grava o perfil bruto no disco e retorna o caminho do arquivo."""
+        os.makedirs(self.output_dir, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+        if SamplingProfiler:
+            path = os.path.join(self.output_dir, f"rerun-{stamp}.pyisession")
+            self._profiler.last_session.save(path)
+            with open(path.replace('.pyisession', '.html'), 'w', encoding='utf-8') as f:
+                f.write(self._profiler.output_html())
+        else:
+            path = os.path.join(self.output_dir, f"rerun-{stamp}.prof")
+            self._profiler.dump_stats(path)
+        return path
+
+    def render(self, container) -> None:
+        """Exibe o painel de perfil no container informado (ex.: st.sidebar)."""
+        if not self.enabled or self._profiler is None or self._started_at is not None:
+            return
+        path = self.dump()
+        engine = 'pyinstrument' if SamplingProfiler else 'cProfile'
+        panel = container.expander("⏱️ Perfil da execução", expanded=True)
+        panel.write(f"**Tempo total:** {self.total * 1000:.0f} ms ({engine})")
+        if self.events:
+            panel.write(", ".join(f"{event}: {count}" for event, count in self.events.items()))
+        panel.dataframe(self.section_table(), hide_index=True)
+        panel.dataframe(self.layer_table(), hide_index=True)
+        panel.code(self.flame_summary(), language=None)
+        panel.write(f"Perfil bruto salvo em `{path}`")
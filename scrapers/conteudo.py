@@ -0,0 +1,307 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, Iterable, Iterator, Optional
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode, urljoin
+
+import pandas as pd
+from bs4 import UnicodeDammit
+from lxml import html as lxml_html
+
+from utils import write_atomic
+from scrapers.noticias import stream_download
+
+logger = logging.getLogger(__name__)
+
+# Diretório do cache de conteúdo (um JSON por artigo, endereçado pelo hash da URL)
+CACHE_DIR = os.path.join('data', 'conteudo')
+
+# Parâmetros de rastreamento removidos na normalização da URL
+TRACKING_PARAMS = re.compile(r'^(utm_\w+|fbclid|gclid|mc_cid|mc_eid|ref|from)$', re.IGNORECASE)
+
+# Elementos que nunca fazem parte do corpo do artigo
+NOISE_TAGS = ['script', 'style', 'noscript', 'nav', 'header', 'footer', 'aside', 'form', 'iframe', 'figure']
+# Classes/ids de blocos que não fazem parte do corpo (comparadas com o token inteiro,
+# então 'article-body social-share-enabled' ou 'layout-with-sidebar' não casam)
+NOISE_CLASSES = re.compile(
+    r'comments?|comment-list|share|sharing|share-buttons|social|social-share|social-links|'
+    r'related|related-posts|related-articles|newsletter|sidebar|promo|advert|advertisement|'
+    r'ads?|banner|menu',
+    re.IGNORECASE
+)
+
+def normalize_url(url: str) -> str:
+    """
+    Normaliza uma URL para uso como chave de cache.
+
+    Remove fragmento, parâmetros de rastreamento e a barra final, e ordena a query.
+
+    Args:
+        url (str): URL do artigo
+
+    Returns:
+        str: URL normalizada
+    """
+    parts = urlparse(url.strip())
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not TRACKING_PARAMS.match(key)
+    )
+    return urlunparse((
+        parts.scheme.lower() or 'https',
+        parts.netloc.lower(),
+        parts.path.rstrip('/') or '/',
+        '',
+        urlencode(query),
+        ''
+    ))
+
+def cache_key(url: str) -> str:
+    """Retorna a chave do cache (SHA-1 da URL normalizada)."""
+    return hashlib.sha1(normalize_url(url).encode('utf-8')).hexdigest()
+
+def _cache_path(key: str, cache_dir: str) -> str:
+    return os.path.join(cache_dir, key[:2], f"{key}.json")
+
+def load_cached(url: str, cache_dir: str = CACHE_DIR) -> Optional[Dict]:
+    """Lê o conteúdo de um artigo do cache, se existir."""
+    path = _cache_path(cache_key(url), cache_dir)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Cache de conteúdo corrompido em {path}: {str(e)}")
+        return None
+
+def store_cached(content: Dict, cache_dir: str = CACHE_DIR) -> None:
+    """Grava o conteúdo de um artigo no cache de forma atômica."""
+    path = _cache_path(cache_key(content['link']), cache_dir)
+    write_atomic(path, json.dumps(content, ensure_ascii=False))
+
+def _meta(tree, *selectors) -> str:
+    """Retorna o primeiro atributo content encontrado entre as meta tags informadas."""
+    for selector in selectors:
+        values = tree.xpath(selector)
+        for value in values:
+            value = value.strip()
+            if value:
+                return value
+    return ""
+
+def _is_noise(element) -> bool:
+    """Indica se algum token de class/id do elemento marca um bloco de ruído."""
+    if element.tag in ('article', 'main'):
+        return False
+    tokens = f"{element.get('class', '')} {element.get('id', '')}".split()
+    return any(NOISE_CLASSES.fullmatch(token) for token in tokens)
+
+def _in_noise(element, stop=None) -> bool:
+    """Indica se o elemento está dentro de um bloco de ruído (sem subir além de `stop`)."""
+    for ancestor in element.iterancestors():
+        if ancestor is stop:
+            return False
+        if isinstance(ancestor.tag, str) and _is_noise(ancestor):
+            return True
+    return False
+
+def _html_parser(page: bytes, encoding: Optional[str]) -> lxml_html.HTMLParser:
+    """
+    Parser lxml com a codificação da página.
+
+    Usa o charset do Content-Type quando existe; senão, detecta pela meta charset,
+    BOM ou conteúdo (o lxml sozinho assumiria latin-1 e corromperia a acentuação).
+    """
+    candidates = [encoding] if encoding else []
+    detected = UnicodeDammit(page, known_definite_encodings=candidates, is_html=True).original_encoding
+    try:
+        return lxml_html.HTMLParser(encoding=detected)
+    except LookupError:
+        return lxml_html.HTMLParser(encoding='utf-8')
+
+def extract_content(page: bytes, url: str, encoding: Optional[str] = None) -> Dict:
+    """
+    Extrai texto principal, imagem de destaque e autor de uma página de artigo.
+
+    Extrator no estilo readability: cada parágrafo pontua o elemento pai (e metade
+    para o avô) pelo tamanho do texto e número de vírgulas; o corpo é o elemento
+    de maior pontuação. Parágrafos dentro de blocos de ruído (comentários,
+    compartilhamento etc.) são ignorados.
+
+    Args:
+        page (bytes): HTML bruto da página
+        url (str): URL do artigo (para resolver links relativos)
+        encoding (str): Charset declarado no Content-Type, se houver
+
+    Returns:
+        Dict: Com as chaves 'link', 'text', 'image' e 'author'
+    """
+    tree = lxml_html.fromstring(page, parser=_html_parser(page, encoding))
+
+    image = _meta(
+        tree,
+        '//meta[@property="og:image"]/@content',
+        '//meta[@name="twitter:image"]/@content'
+    )
+    author = _meta(
+        tree,
+        '//meta[@name="author"]/@content',
+        '//meta[@property="article:author"]/@content',
+        '//*[@itemprop="author"]//*[@itemprop="name"]/text()',
+        '//*[@rel="author"]/text()',
+        '//*[contains(@class, "author")]/text()'
+    )
+
+    for element in tree.xpath('//' + ' | //'.join(NOISE_TAGS)):
+        element.drop_tree()
+
+    # Blocos de ruído não são apagados (podem envolver o corpo); seus parágrafos
+    # apenas não pontuam nem entram no texto
+    scores = defaultdict(float)
+    for paragraph in tree.iter('p'):
+        text = paragraph.text_content().strip()
+        if len(text) < 25 or _in_noise(paragraph):
+            continue
+        score = 1 + text.count(',') + min(len(text) / 100, 3)
+        parent = paragraph.getparent()
+        if parent is not None:
+            scores[parent] += score
+            grandparent = parent.getparent()
+            if grandparent is not None:
+                scores[grandparent] += score / 2
+
+    text = ""
+    if scores:
+        body = max(scores, key=scores.get)
+        paragraphs = (p.text_content().strip() for p in body.iter('p') if not _in_noise(p, stop=body))
+        text = "\n\n".join(p for p in paragraphs if len(p) >= 25)
+        if not image:
+            images = body.xpath('.//img/@src')
+            image = images[0] if images else ""
+
+    return {
+        'link': url,
+        'text': text,
+        'image': urljoin(url, image) if image else "",
+        'author': re.sub(r'\s+', ' ', author)
+    }
+
+class HostLimiter:
+    """Limita o número de requisições simultâneas por host."""
+
+    def __init__(self, per_host: int):
+        self.per_host = per_host
+        self._lock = threading.Lock()
+        self._semaphores = {}
+
+    def __call__(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.per_host)
+            return self._semaphores[host]
+
+def _fetch_one(url: str, limiter: HostLimiter, cache_dir: str, timeout: float) -> Optional[Dict]:
+    """Baixa, extrai e grava no cache o conteúdo de um artigo."""
+    with limiter(url):
+        status_code, body, encoding = stream_download(url, timeout=timeout)
+    if status_code != 200:
+        logger.error(f"Erro no status code ao baixar {url}: {status_code}")
+        return None
+
+    content = extract_content(body, url, encoding)
+    store_cached(content, cache_dir)
+    return content
+
+def fetch_contents(
+    urls: Iterable[str],
+    max_workers: int = 8,
+    per_host: int = 2,
+    cache_dir: str = CACHE_DIR,
+    timeout: float = 15
+) -> Iterator[Dict]:
+    """
+    Busca o conteúdo de vários artigos, usando o cache sempre que possível.
+
+    No máximo `max_workers` downloads ficam em andamento (e `per_host` por site),
+    e as URLs são consumidas sob demanda, então memória e conexões continuam
+    limitadas mesmo com centenas de links novos. Cada URL normalizada é baixada
+    no máximo uma vez.
+
+    Args:
+        urls: Links dos artigos
+        max_workers (int): Downloads simultâneos
+        per_host (int): Downloads simultâneos por host
+        cache_dir (str): Diretório do cache de conteúdo
+        timeout (float): Timeout de cada requisição, em segundos
+
+    Yields:
+        Dict: Conteúdo de cada artigo (ordem de conclusão, não de entrada)
+    """
+    limiter = HostLimiter(per_host)
+    pending_keys = set()
+    urls = iter(urls)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running = {}
+        exhausted = False
+
+        while running or not exhausted:
+            while not exhausted and len(running) < max_workers:
+                url = next(urls, None)
+                if url is None:
+                    exhausted = True
+                    break
+
+                key = cache_key(url)
+                if key in pending_keys:
+                    continue
+                pending_keys.add(key)
+
+                cached = load_cached(url, cache_dir)
+                if cached is not None:
+                    yield cached
+                    continue
+
+                running[executor.submit(_fetch_one, url, limiter, cache_dir, timeout)] = url
+
+            if not running:
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                url = running.pop(future)
+                try:
+                    content = future.result()
+                except Exception as e:
+                    logger.error(f"Erro ao extrair conteúdo de {url}: {str(e)}")
+                    continue
+                if content is not None:
+                    yield content
+
+def add_contents(df: pd.DataFrame, **kwargs) -> pd.DataFrame:
+    """
+    Adiciona as colunas 'text', 'image' e 'author' ao DataFrame de notícias.
+
+    Args:
+        df (pd.DataFrame): Notícias com a coluna 'link'
+        **kwargs: Repassados para fetch_contents
+
+    Returns:
+        pd.DataFrame: Cópia do DataFrame com o conteúdo dos artigos
+    """
+    if df.empty:
+        return df.assign(text=pd.Series(dtype=str), image=pd.Series(dtype=str), author=pd.Series(dtype=str))
+
+    contents = {cache_key(c['link']): c for c in fetch_contents(df['link'], **kwargs)}
+    keys = df['link'].map(cache_key)
+    df = df.copy()
+    for column in ('text', 'image', 'author'):
+        df[column] = keys.map(lambda key: contents.get(key, {}).get(column, ""))
+    return df
@@ -0,0 +1,270 @@
+import argparse
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set
+from urllib.parse import urljoin, urlparse
+
+import pandas as pd
+
+from scrapers.noticias import (
+    make_request,
+    validate_article,
+    extract_published_at,
+    merge_by_freshness,
+    create_dataframe
+)
+from utils import parse_datetime
+from scrapers.tendencias import trend_stats
+
+logger = logging.getLogger(__name__)
+
+# Configuração das listagens paginadas de cada fonte.
+# 'page_url' é usado quando a página não expõe um link de "próxima página";
+# sem nenhum dos dois, a fonte é percorrida só na primeira página.
+CRAWL_SOURCES = {
+    'Olhar Digital': {
+        'category': 'Technology',
+        'url': 'https://olhardigital.com.br/editorias/noticias/',
+        'item_selector': '.latest-posts article, .post-list article, article.post',
+        'title_selector': 'h2 a, h3 a, .title a, a[title]',
+        'page_url': 'https://olhardigital.com.br/editorias/noticias/page/{page}/'
+    },
+    'Canaltech': {
+        'category': 'Technology',
+        'url': 'https://canaltech.com.br/ultimas/',
+        'item_selector': '.latest-news article, .news-list article, article.news-item',
+        'title_selector': 'h2 a, h3 a, .title a, a[title]'
+    },
+    'Exame': {
+        'category': 'Business',
+        'url': 'https://exame.com/negocios/',
+        'item_selector': 'article.article-card',
+        'title_selector': 'h2.article-card__title a'
+    },
+    'CNN Brazil': {
+        'category': 'Business',
+        'url': 'https://www.cnnbrasil.com.br/business/',
+        'item_selector': '.home__list__item',
+        'title_selector': 'h2.news-item-header__title a',
+        'page_url': 'https://www.cnnbrasil.com.br/business/pagina/{page}/'
+    },
+    'Space.com': {
+        'category': 'Astronomy',
+        'url': 'https://www.space.com/news',
+        'item_selector': 'article.listing-item',
+        'title_selector': 'h3.article-name a',
+        'page_url': 'https://www.space.com/news/archive/{page}'
+    },
+    'Galileu': {
+        'category': 'Astronomy',
+        'url': 'https://revistagalileu.globo.com/ciencia/',
+        'item_selector': '.feed-post-body',
+        'title_selector': '.feed-post-link'
+    },
+    'CNN Brazil Economy': {
+        'category': 'Economy',
+        'url': 'https://www.cnnbrasil.com.br/economia/',
+        'item_selector': '.home__list__item',
+        'title_selector': 'h2.news-item-header__title a',
+        'page_url': 'https://www.cnnbrasil.com.br/economia/pagina/{page}/'
+    },
+    'Exame Economy': {
+        'category': 'Economy',
+        'url': 'https://exame.com/economia/',
+        'item_selector': 'article.article-card',
+        'title_selector': 'h2.article-card__title a'
+    },
+    'Livecoins': {
+        'category': 'Cryptocurrency',
+        'url': 'https://livecoins.com.br/ultimas-noticias/',
+        'item_selector': 'article.jeg_post',
+        'title_selector': 'h3.jeg_post_title a',
+        'page_url': 'https://livecoins.com.br/ultimas-noticias/page/{page}/'
+    },
+    'Cointelegraph Brazil': {
+        'category': 'Cryptocurrency',
+        'url': 'https://br.cointelegraph.com/news',
+        'item_selector': 'article.post-card',
+        'title_selector': 'a.post-card__title-link'
+    }
+}
+
+# Links de "próxima página" mais comuns em listagens
+NEXT_PAGE_SELECTORS = [
+    'link[rel="next"]',
+    'a[rel="next"]',
+    '.pagination a.next',
+    'a.next',
+    'a.load-more',
+    '.pagination-next a'
+]
+
+def parse_listing(soup, source: str, config: Dict) -> List[Dict]:
+    """Extrai os artigos de uma página de listagem de acordo com a configuração da fonte."""
+    base = '{0.scheme}://{0.netloc}'.format(urlparse(config['url']))
+    articles = []
+
+    for item in soup.select(config['item_selector']):
+        title_elem = item.select_one(config['title_selector'])
+        if not title_elem:
+            continue
+
+        title = title_elem.get_text(strip=True)
+        link = title_elem.get('href', '')
+        if validate_article(title, link, base):
+            articles.append({
+                'title': title,
+                'link': urljoin(base + '/', link),
+                'source': source,
+                'category': config['category'],
+                'published_at': extract_published_at(item)
+            })
+
+    return articles
+
+def find_next_page(soup, current_url: str, page: int, config: Dict) -> Optional[str]:
+    """Descobre a URL da próxima página da listagem."""
+    for selector in NEXT_PAGE_SELECTORS:
+        next_elem = soup.select_one(selector)
+        if next_elem and next_elem.get('href'):
+            return urljoin(current_url, next_elem['href'])
+
+    if config.get('page_url'):
+        return config['page_url'].format(page=page + 1)
+
+    return None
+
+def _crawl_page(source: str, url: str, page: int, config: Dict):
+    """Baixa e interpreta uma página; executado no pool de threads."""
+    # Página inteira: os links de paginação costumam ficar no fim da listagem
+    soup = make_request(url)
+    if not soup:
+        return [], None
+    return parse_listing(soup, source, config), find_next_page(soup, url, page, config)
+
+def crawl(
+    sources: Optional[List[str]] = None,
+    category: Optional[str] = None,
+    seen: Optional[Set[str]] = None,
+    cutoff: Optional[datetime] = None,
+    max_pages: int = 5,
+    time_budget: float = 120,
+    max_workers: int = 4
+) -> pd.DataFrame:
+    """
+    Percorre várias páginas das listagens das fontes.
+
+    A fronteira tem no máximo `max_workers` páginas em andamento, e cada fonte
+    tem no máximo uma (a próxima página só é conhecida após baixar a atual). Uma
+    fonte para ao atingir `max_pages`, o orçamento de tempo, um artigo que já está
+    em `seen`, uma página sem nenhum artigo novo (ex.: servidor que ignora o
+    parâmetro de página) ou uma página cujos artigos são todos anteriores a `cutoff`.
+
+    Args:
+        sources (List[str]): Fontes de CRAWL_SOURCES (padrão: todas)
+        category (str): Restringe às fontes de uma categoria
+        seen (Set[str]): Links já arquivados
+        cutoff (datetime): Data mínima de publicação (sem fuso: horário de Brasília)
+        max_pages (int): Profundidade máxima por fonte
+        time_budget (float): Tempo máximo por fonte, em segundos
+        max_workers (int): Páginas baixadas em paralelo
+
+    Returns:
+        pd.DataFrame: Artigos novos, do mais recente para o mais antigo
+    """
+    archived = set(seen or ())
+    cutoff = parse_datetime(cutoff) if cutoff is not None else None
+    collected = set()
+    names = [
+        name for name in (sources or CRAWL_SOURCES)
+        if category is None or CRAWL_SOURCES[name]['category'] == category
+    ]
+    results = {name: [] for name in names}
+    deadlines = {name: time.monotonic() + time_budget for name in names}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        frontier = [(name, CRAWL_SOURCES[name]['url'], 1) for name in names]
+        running = {}
+
+        while frontier or running:
+            while frontier and len(running) < max_workers:
+                name, url, page = frontier.pop(0)
+                logger.info(f"[crawler] {name}: página {page} - {url}")
+                future = executor.submit(_crawl_page, name, url, page, CRAWL_SOURCES[name])
+                running[future] = (name, url, page)
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name, url, page = running.pop(future)
+                try:
+                    articles, next_url = future.result()
+                except Exception as e:
+                    logger.error(f"[crawler] Erro ao percorrer {name} ({url}): {str(e)}")
+                    continue
+
+                new_articles = []
+                reached_seen = False
+                for article in articles:
+                    if article['link'] in archived:
+                        reached_seen = True
+                        continue
+                    # Repetições dentro da varredura (ex.: destaque em várias
+                    # páginas) são descartadas, mas não encerram a fonte
+                    if article['link'] in collected:
+                        continue
+                    collected.add(article['link'])
+                    new_articles.append(article)
+                results[name].extend(new_articles)
+
+                dated = [a['published_at'] for a in articles if a['published_at']]
+                too_old = cutoff is not None and dated and max(dated) < cutoff
+
+                if not new_articles or reached_seen or too_old:
+                    logger.info(f"[crawler] {name}: parada antecipada na página {page}")
+                elif page >= max_pages or time.monotonic() > deadlines[name]:
+                    logger.info(f"[crawler] {name}: orçamento esgotado na página {page}")
+                elif next_url and next_url != url:
+                    frontier.append((name, next_url, page + 1))
+
+    articles = merge_by_freshness(results.values(), cutoff=cutoff)
+    logger.info(f"[crawler] Total de {len(articles)} artigos novos")
+    return create_dataframe(articles)
+
+def main():
+    """Ponto de entrada para recuperar o arquivo após um período fora do ar."""
+    parser = argparse.ArgumentParser(description="Varredura profunda das listagens de notícias.")
+    parser.add_argument('--category', help="Categoria em inglês (ex.: Business)")
+    parser.add_argument('--pages', type=int, default=5, help="Profundidade máxima por fonte")
+    parser.add_argument('--budget', type=float, default=120, help="Tempo máximo por fonte (s)")
+    parser.add_argument('--workers', type=int, default=4, help="Páginas baixadas em paralelo")
+    parser.add_argument('--hours', type=float, help="Ignora artigos mais antigos que N horas")
+    parser.add_argument('--output', default='data/arquivo.csv', help="CSV do arquivo de notícias")
+    args = parser.parse_args()
+
+    archive = pd.DataFrame()
+    if os.path.exists(args.output):
+        archive = pd.read_csv(args.output)
+    seen = set(archive['link']) if 'link' in archive else set()
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=args.hours) if args.hours else None
+
+    df = crawl(
+        category=args.category,
+        seen=seen,
+        cutoff=cutoff,
+        max_pages=args.pages,
+        time_budget=args.budget,
+        max_workers=args.workers
+    )
+
+    trend_stats.ingest_dataframe(df)
+    trend_stats.save()
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    pd.concat([df, archive], ignore_index=True).to_csv(args.output, index=False)
+    logger.info(f"[crawler] {len(df)} artigos adicionados a {args.output}")
+
+if __name__ == '__main__':
+    main()
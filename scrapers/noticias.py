@@ -1,10 +1,19 @@
 import requests
 from bs4 import BeautifulSoup
 import pandas as pd
-from typing import List, Dict
+from typing import List, Dict, Iterable, Optional
+from datetime import datetime, timezone
+from itertools import islice, takewhile
+import heapq
+import io
 import logging
 import time
 import random
+import os
+import re
+from urllib3.util.request import ACCEPT_ENCODING
+from utils import parse_datetime, safe_extract
+from scrapers.seletores import selector_stats
 
 # Configuração do logging com mais detalhes
 logging.basicConfig(
@@ -13,31 +22,98 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def make_request(url: str) -> BeautifulSoup:
+# Cabeçalhos HTTP usados nas requisições às fontes
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
+    # gzip/deflate sempre; br e zstd quando brotli/zstandard estão instalados
+    'Accept-Encoding': ACCEPT_ENCODING.replace(',', ', '),
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Cache-Control': 'max-age=0'
+}
+
+# Tamanho máximo (descomprimido) de uma página; o excedente é descartado
+MAX_RESPONSE_BYTES = int(os.getenv('SCRAPER_MAX_BYTES', 5 * 1024 * 1024))
+
+# Marcador do fim da área de listagem, por fonte: o restante da página (rodapé,
+# scripts) não é baixado. Uma fonte só deve entrar aqui depois de conferido que
+# todos os seus itens vêm antes do marcador (ex.: {'Exame': b'</main>'})
+LISTING_END_MARKERS: Dict[str, bytes] = {}
+
+# Charset declarado no cabeçalho Content-Type
+CHARSET_PATTERN = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+
+CHUNK_SIZE = 64 * 1024
+
+def stream_download(
+    url: str,
+    headers: Optional[Dict] = None,
+    timeout: float = 15,
+    max_bytes: int = MAX_RESPONSE_BYTES,
+    stop_after: Optional[bytes] = None
+):
+    """
+    Baixa uma página em blocos, com limite de tamanho e parada antecipada.
+
+    Args:
+        url (str): URL da página
+        headers (Dict): Cabeçalhos HTTP (padrão: DEFAULT_HEADERS)
+        timeout (float): Timeout da requisição, em segundos
+        max_bytes (int): Interrompe o download após este número de bytes
+        stop_after (bytes): Interrompe o download assim que este marcador é recebido
+
+    Returns:
+        Tuple[int, bytes, str]: Status code, corpo da resposta (vazio se status != 200)
+            e charset declarado no Content-Type (None se ausente)
+    """
+    with requests.get(url, headers=headers or DEFAULT_HEADERS, timeout=timeout, stream=True) as response:
+        if response.status_code != 200:
+            return response.status_code, b'', None
+
+        # Sem charset no cabeçalho, a detecção fica com o parser (meta charset)
+        match = CHARSET_PATTERN.search(response.headers.get('Content-Type', ''))
+        encoding = match.group(1) if match else None
+
+        # BytesIO.getvalue() devolve o próprio buffer, sem uma segunda cópia da página
+        body = io.BytesIO()
+        overlap = len(stop_after) - 1 if stop_after else 0
+        tail = b''
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            body.write(chunk)
+            size = body.tell()
+
+            # O marcador pode começar no fim do bloco anterior
+            if stop_after and (tail + chunk).find(stop_after) != -1:
+                logger.info(f"Área de interesse recebida, download interrompido em {size} bytes")
+                break
+            if size >= max_bytes:
+                logger.warning(f"Página excedeu {max_bytes} bytes, download interrompido: {url}")
+                body.truncate(max_bytes)
+                break
+            tail = (tail + chunk)[-overlap:] if overlap else b''
+
+        return response.status_code, body.getvalue(), encoding
+
+def make_request(url: str, stop_after: Optional[bytes] = None) -> BeautifulSoup:
     """Faz requisição HTTP e retorna objeto BeautifulSoup."""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Cache-Control': 'max-age=0'
-        }
         logger.info(f"Tentando acessar URL: {url}")
 
         # Adiciona um delay aleatório entre 1 e 3 segundos
         time.sleep(1 + 2 * random.random())
 
-        response = requests.get(url, headers=headers, timeout=15)
-        logger.info(f"Status code: {response.status_code}")
+        status_code, body, encoding = stream_download(url, stop_after=stop_after)
+        logger.info(f"Status code: {status_code}")
 
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
-            logger.info(f"Página carregada com sucesso: {len(response.text)} bytes")
+        if status_code == 200:
+            # O lxml interpreta os bytes diretamente, sem manter uma cópia decodificada
+            soup = BeautifulSoup(body, 'lxml', from_encoding=encoding)
+            logger.info(f"Página carregada com sucesso: {len(body)} bytes")
             return soup
         else:
-            logger.error(f"Erro no status code: {response.status_code}")
+            logger.error(f"Erro no status code: {status_code}")
             return None
 
     except Exception as e:
@@ -57,66 +133,186 @@ def validate_article(title: str, link: str, base_url: str) -> bool:
 
     return True  # Simplificando a validação para evitar falsos negativos
 
+# Seletores candidatos para o título nas páginas com layout variável
+TITLE_SELECTORS = ['h1 a', 'h2 a', 'h3 a', '.title a', 'a[title]']
+
+def has_title_text(element) -> bool:
+    """Indica se o elemento tem texto suficiente para ser um título (links de imagem não têm)."""
+    return len(element.get_text(strip=True)) >= 5
+
+# Locais onde os sites costumam expor a data de publicação, em ordem de preferência
+PUBLISHED_AT_SELECTORS = [
+    ('time[datetime]', 'datetime'),
+    ('meta[property="article:published_time"]', 'content'),
+    ('meta[itemprop="datePublished"]', 'content'),
+    ('[itemprop="datePublished"]', 'datetime'),
+    ('[data-published]', 'data-published'),
+    ('.feed-post-datetime', None),  # Globo: "Há 2 horas"
+    ('time', None)
+]
+
+# Artigos sem data ficam depois de todos os datados na ordenação
+_OLDEST = datetime.min.replace(tzinfo=timezone.utc)
+
+def extract_published_at(item) -> Optional[datetime]:
+    """Extrai a data de publicação de um item da listagem (tags <time>, meta tags ou campos de feed)."""
+    if item is None:
+        return None
+
+    if item.name == 'time':
+        published_at = parse_datetime(item.get('datetime') or item.get_text(strip=True))
+        if published_at:
+            return published_at
+
+    # Campos de feed RSS/Atom (o parser HTML do lxml converte as tags para minúsculas)
+    for field in ('pubdate', 'published', 'updated'):
+        feed_elem = item.find(field)
+        if feed_elem:
+            published_at = parse_datetime(feed_elem.get_text(strip=True))
+            if published_at:
+                return published_at
+
+    for selector, attr in PUBLISHED_AT_SELECTORS:
+        published_at = parse_datetime(safe_extract(item, selector, attr))
+        if published_at:
+            return published_at
+
+    return None
+
+def _freshness_key(article: Dict) -> datetime:
+    """Chave de ordenação por data de publicação."""
+    return article.get('published_at') or _OLDEST
+
+def merge_by_freshness(
+    streams: Iterable[Iterable[Dict]],
+    limit: Optional[int] = None,
+    cutoff: Optional[datetime] = None
+) -> List[Dict]:
+    """
+    Intercala os artigos de várias fontes, do mais recente para o mais antigo.
+
+    Cada fonte é um fluxo ordenado do mais recente para o mais antigo; listas são
+    ordenadas aqui, iteradores (ex.: paginação) são consumidos sob demanda. A
+    intercalação é um merge de k vias com heap, então só são lidos os artigos
+    necessários para os primeiros `limit` e nada depois de `cutoff`.
+
+    Artigos sem data não participam do corte: entram depois dos datados (na ordem
+    das fontes), já que a maioria das fontes não publica a data na listagem.
+
+    Args:
+        streams: Fluxos de artigos, um por fonte
+        limit (int): Número máximo de artigos retornados
+        cutoff (datetime): Descarta artigos publicados antes desta data
+            (datas sem fuso são interpretadas no horário de Brasília)
+
+    Returns:
+        List[Dict]: Artigos em ordem decrescente de publicação, seguidos dos sem data
+    """
+    if cutoff is not None:
+        cutoff = parse_datetime(cutoff)
+
+    undated = []
+
+    def dated_only(stream):
+        # Separa os artigos sem data à medida que o fluxo é consumido
+        for article in stream:
+            if article.get('published_at'):
+                yield article
+            else:
+                undated.append(article)
+
+    sorted_streams = []
+    for stream in streams:
+        if isinstance(stream, list):
+            undated.extend(article for article in stream if not article.get('published_at'))
+            stream = sorted(
+                (article for article in stream if article.get('published_at')),
+                key=_freshness_key,
+                reverse=True
+            )
+        else:
+            stream = dated_only(stream)
+        sorted_streams.append(stream)
+
+    merged = heapq.merge(*sorted_streams, key=_freshness_key, reverse=True)
+
+    if cutoff is not None:
+        # Como o merge é decrescente, o primeiro artigo antigo encerra todos os fluxos
+        merged = takewhile(lambda article: _freshness_key(article) >= cutoff, merged)
+
+    articles = list(islice(merged, limit))
+    remaining = None if limit is None else max(limit - len(articles), 0)
+    return articles + undated[:remaining]
+
+def merge_sources(sources: Dict[str, List[Dict]]) -> pd.DataFrame:
+    """Registra o rendimento de cada fonte e cria o DataFrame intercalado por data."""
+    for source, articles in sources.items():
+        selector_stats.record_yield(source, len(articles))
+    selector_stats.save()
+    return create_dataframe(merge_by_freshness(sources.values()))
+
 def create_dataframe(articles: List[Dict]) -> pd.DataFrame:
     """Cria DataFrame a partir da lista de artigos."""
     if not articles:
         logger.warning("Nenhum artigo encontrado para criar o DataFrame")
-        return pd.DataFrame(columns=['title', 'link', 'source', 'category'])
+        return pd.DataFrame(columns=['title', 'link', 'source', 'category', 'published_at'])
 
     logger.info(f"Criando DataFrame com {len(articles)} artigos")
-    return pd.DataFrame(articles)
+    df = pd.DataFrame(articles)
+    if 'published_at' not in df.columns:
+        df['published_at'] = None
+    df['published_at'] = pd.to_datetime(df['published_at'], utc=True)
+    return df
 
 def fetch_technology() -> pd.DataFrame:
     """Busca notícias de tecnologia do Olhar Digital e Canaltech."""
-    articles = []
+    olhar_articles = []
+    canaltech_articles = []
 
     # Olhar Digital
     try:
         logger.info("Iniciando busca no Olhar Digital...")
         base_url = 'https://olhardigital.com.br/editorias/noticias/'
-        soup = make_request(base_url)
+        soup = make_request(base_url, stop_after=LISTING_END_MARKERS.get('Olhar Digital'))
 
         if soup:
             # Busca por artigos na página inicial
             logger.info("Buscando artigos no Olhar Digital...")
 
             # Tenta diferentes áreas da página
-            news_areas = [
-                soup.select('.main-carousel article'),  # Carrossel principal
-                soup.select('.featured-posts article'),  # Posts em destaque
-                soup.select('.latest-posts article'),   # Últimos posts
-                soup.select('.post-list article'),      # Lista de posts
-                soup.select('article.post')             # Artigos gerais
-            ]
-
-            for area in news_areas:
-                logger.info(f"Encontrados {len(area)} artigos em uma área")
-                for item in area:
-                    # Tenta diferentes elementos para título e link
-                    title_elem = (
-                        item.select_one('h1 a') or
-                        item.select_one('h2 a') or
-                        item.select_one('h3 a') or
-                        item.select_one('.title a') or
-                        item.select_one('a[title]')
-                    )
-
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        link = title_elem.get('href', '')
+            news_areas = selector_stats.select_areas(soup, 'Olhar Digital', 'area', [
+                '.main-carousel article',  # Carrossel principal
+                '.featured-posts article', # Posts em destaque
+                '.latest-posts article',   # Últimos posts
+                '.post-list article',      # Lista de posts
+                'article.post'             # Artigos gerais
+            ])
+
+            for selector, area in news_areas:
+                logger.info(f"Encontrados {len(area)} artigos na área '{selector}'")
+
+            # Tenta diferentes elementos para título e link, do mais ao menos eficaz
+            items = [item for _, area in news_areas for item in area]
+            for item, title_elem in selector_stats.select_each(
+                items, 'Olhar Digital', 'title', TITLE_SELECTORS, accept=has_title_text
+            ):
+                if title_elem:
+                    title = title_elem.get_text(strip=True)
+                    link = title_elem.get('href', '')
 
-                        logger.info(f"Encontrado artigo: {title[:50]}... - {link}")
+                    logger.info(f"Encontrado artigo: {title[:50]}... - {link}")
 
-                        if validate_article(title, link, base_url):
-                            if not link.startswith(('http://', 'https://')):
-                                link = base_url + link.lstrip('/')
+                    if validate_article(title, link, base_url):
+                        if not link.startswith(('http://', 'https://')):
+                            link = base_url + link.lstrip('/')
 
-                            articles.append({
-                                'title': title,
-                                'link': link,
-                                'source': 'Olhar Digital',
-                                'category': 'Technology'
-                            })
+                        olhar_articles.append({
+                            'title': title,
+                            'link': link,
+                            'source': 'Olhar Digital',
+                            'category': 'Technology',
+                            'published_at': extract_published_at(item)
+                        })
 
     except Exception as e:
         logger.error(f"Erro ao buscar notícias do Olhar Digital: {str(e)}")
@@ -126,65 +322,63 @@ def fetch_technology() -> pd.DataFrame:
     try:
         logger.info("Buscando notícias do Canaltech...")
         base_url = 'https://canaltech.com.br'
-        soup = make_request(base_url)
+        soup = make_request(base_url, stop_after=LISTING_END_MARKERS.get('Canaltech'))
 
         if soup:
             logger.info("Buscando artigos no Canaltech...")
 
             # Tenta diferentes áreas da página
-            news_areas = [
-                soup.select('.featured-news article'),  # Notícias em destaque
-                soup.select('.latest-news article'),    # Últimas notícias
-                soup.select('.news-list article'),      # Lista de notícias
-                soup.select('article.news-item'),       # Items de notícia
-                soup.select('.main-content article')    # Conteúdo principal
-            ]
-
-            for area in news_areas:
-                logger.info(f"Encontrados {len(area)} artigos em uma área")
-                for item in area:
-                    # Tenta diferentes elementos para título e link
-                    title_elem = (
-                        item.select_one('h1 a') or
-                        item.select_one('h2 a') or
-                        item.select_one('h3 a') or
-                        item.select_one('.title a') or
-                        item.select_one('a[title]')
-                    )
-
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        link = title_elem.get('href', '')
+            news_areas = selector_stats.select_areas(soup, 'Canaltech', 'area', [
+                '.featured-news article',  # Notícias em destaque
+                '.latest-news article',    # Últimas notícias
+                '.news-list article',      # Lista de notícias
+                'article.news-item',       # Items de notícia
+                '.main-content article'    # Conteúdo principal
+            ])
+
+            for selector, area in news_areas:
+                logger.info(f"Encontrados {len(area)} artigos na área '{selector}'")
+
+            # Tenta diferentes elementos para título e link, do mais ao menos eficaz
+            items = [item for _, area in news_areas for item in area]
+            for item, title_elem in selector_stats.select_each(
+                items, 'Canaltech', 'title', TITLE_SELECTORS, accept=has_title_text
+            ):
+                if title_elem:
+                    title = title_elem.get_text(strip=True)
+                    link = title_elem.get('href', '')
 
-                        logger.info(f"Encontrado artigo: {title[:50]}... - {link}")
+                    logger.info(f"Encontrado artigo: {title[:50]}... - {link}")
 
-                        if validate_article(title, link, base_url):
-                            if not link.startswith(('http://', 'https://')):
-                                link = base_url + link.lstrip('/')
+                    if validate_article(title, link, base_url):
+                        if not link.startswith(('http://', 'https://')):
+                            link = base_url + link.lstrip('/')
 
-                            articles.append({
-                                'title': title,
-                                'link': link,
-                                'source': 'Canaltech',
-                                'category': 'Technology'
-                            })
+                        canaltech_articles.append({
+                            'title': title,
+                            'link': link,
+                            'source': 'Canaltech',
+                            'category': 'Technology',
+                            'published_at': extract_published_at(item)
+                        })
 
     except Exception as e:
         logger.error(f"Erro ao buscar notícias do Canaltech: {str(e)}")
         logger.exception("Detalhes do erro:")
 
-    logger.info(f"Total de artigos encontrados: {len(articles)}")
-    return create_dataframe(articles)
+    logger.info(f"Total de artigos encontrados: {len(olhar_articles) + len(canaltech_articles)}")
+    return merge_sources({'Olhar Digital': olhar_articles, 'Canaltech': canaltech_articles})
 
 def fetch_business() -> pd.DataFrame:
     """Busca notícias de negócios da Exame e CNN Brazil."""
-    articles = []
+    exame_articles = []
+    cnn_articles = []
 
     # Exame
     try:
         logger.info("Buscando notícias da Exame (Negócios)...")
         base_url = 'https://exame.com'
-        soup = make_request(base_url + '/negocios/')
+        soup = make_request(base_url + '/negocios/', stop_after=LISTING_END_MARKERS.get('Exame'))
         if soup:
             news_items = soup.select('article.article-card')
             for item in news_items[:10]:
@@ -194,13 +388,14 @@ def fetch_business() -> pd.DataFrame:
                     link = title_elem.a['href']
 
                     if validate_article(title, link, base_url):
-                        articles.append({
+                        exame_articles.append({
                             'title': title,
                             'link': link,
                             'source': 'Exame',
-                            'category': 'Business'
+                            'category': 'Business',
+                            'published_at': extract_published_at(item)
                         })
-            logger.info(f"Encontradas {len(articles)} notícias da Exame")
+            logger.info(f"Encontradas {len(exame_articles)} notícias da Exame")
     except Exception as e:
         logger.error(f"Erro ao buscar notícias da Exame: {str(e)}")
 
@@ -208,10 +403,9 @@ def fetch_business() -> pd.DataFrame:
     try:
         logger.info("Buscando notícias da CNN Brazil (Negócios)...")
         base_url = 'https://www.cnnbrasil.com.br'
-        soup = make_request(base_url + '/business/')
+        soup = make_request(base_url + '/business/', stop_after=LISTING_END_MARKERS.get('CNN Brazil'))
         if soup:
             news_items = soup.select('.home__list__item')
-            cnn_articles = []
             for item in news_items[:10]:
                 title_elem = item.select_one('h2.news-item-header__title')
                 if title_elem and title_elem.a:
@@ -223,24 +417,25 @@ def fetch_business() -> pd.DataFrame:
                             'title': title,
                             'link': link,
                             'source': 'CNN Brazil',
-                            'category': 'Business'
+                            'category': 'Business',
+                            'published_at': extract_published_at(item)
                         })
-            articles.extend(cnn_articles)
             logger.info(f"Encontradas {len(cnn_articles)} notícias da CNN Brazil")
     except Exception as e:
         logger.error(f"Erro ao buscar notícias da CNN Brazil: {str(e)}")
 
-    return create_dataframe(articles)
+    return merge_sources({'Exame': exame_articles, 'CNN Brazil': cnn_articles})
 
 def fetch_astronomy() -> pd.DataFrame:
     """Busca notícias de astronomia do Space.com e Galileu."""
-    articles = []
+    space_articles = []
+    galileu_articles = []
 
     # Space.com
     try:
         logger.info("Buscando notícias do Space.com...")
         base_url = 'https://www.space.com'
-        soup = make_request(base_url + '/news')
+        soup = make_request(base_url + '/news', stop_after=LISTING_END_MARKERS.get('Space.com'))
         if soup:
             news_items = soup.select('article.listing-item')
             for item in news_items[:10]:
@@ -250,13 +445,14 @@ def fetch_astronomy() -> pd.DataFrame:
                     link = title_elem.a['href']
 
                     if validate_article(title, link, base_url):
-                        articles.append({
+                        space_articles.append({
                             'title': title,
                             'link': base_url + link,
                             'source': 'Space.com',
-                            'category': 'Astronomy'
+                            'category': 'Astronomy',
+                            'published_at': extract_published_at(item)
                         })
-            logger.info(f"Encontradas {len(articles)} notícias do Space.com")
+            logger.info(f"Encontradas {len(space_articles)} notícias do Space.com")
     except Exception as e:
         logger.error(f"Erro ao buscar notícias do Space.com: {str(e)}")
 
@@ -264,10 +460,9 @@ def fetch_astronomy() -> pd.DataFrame:
     try:
         logger.info("Buscando notícias da Galileu...")
         base_url = 'https://revistagalileu.globo.com'
-        soup = make_request(base_url + '/ciencia/')
+        soup = make_request(base_url + '/ciencia/', stop_after=LISTING_END_MARKERS.get('Galileu'))
         if soup:
             news_items = soup.select('.feed-post-body')
-            galileu_articles = []
             for item in news_items[:10]:
                 title_elem = item.select_one('.feed-post-link')
                 if title_elem:
@@ -279,24 +474,25 @@ def fetch_astronomy() -> pd.DataFrame:
                             'title': title,
                             'link': link,
                             'source': 'Galileu',
-                            'category': 'Astronomy'
+                            'category': 'Astronomy',
+                            'published_at': extract_published_at(item)
                         })
-            articles.extend(galileu_articles)
             logger.info(f"Encontradas {len(galileu_articles)} notícias da Galileu")
     except Exception as e:
         logger.error(f"Erro ao buscar notícias da Galileu: {str(e)}")
 
-    return create_dataframe(articles)
+    return merge_sources({'Space.com': space_articles, 'Galileu': galileu_articles})
 
 def fetch_economy() -> pd.DataFrame:
     """Busca notícias de economia da CNN Brazil Economy e Exame."""
-    articles = []
+    cnn_articles = []
+    exame_articles = []
 
     # CNN Brazil Economy
     try:
         logger.info("Buscando notícias da CNN Brazil (Economia)...")
         base_url = 'https://www.cnnbrasil.com.br'
-        soup = make_request(base_url + '/economia/')
+        soup = make_request(base_url + '/economia/', stop_after=LISTING_END_MARKERS.get('CNN Brazil Economy'))
         if soup:
             news_items = soup.select('.home__list__item')
             for item in news_items[:10]:
@@ -306,13 +502,14 @@ def fetch_economy() -> pd.DataFrame:
                     link = title_elem.a['href']
 
                     if validate_article(title, link, base_url):
-                        articles.append({
+                        cnn_articles.append({
                             'title': title,
                             'link': link,
                             'source': 'CNN Brazil Economy',
-                            'category': 'Economy'
+                            'category': 'Economy',
+                            'published_at': extract_published_at(item)
                         })
-            logger.info(f"Encontradas {len(articles)} notícias da CNN Brazil Economy")
+            logger.info(f"Encontradas {len(cnn_articles)} notícias da CNN Brazil Economy")
     except Exception as e:
         logger.error(f"Erro ao buscar notícias da CNN Brazil Economy: {str(e)}")
 
@@ -320,10 +517,9 @@ def fetch_economy() -> pd.DataFrame:
     try:
         logger.info("Buscando notícias da Exame (Economia)...")
         base_url = 'https://exame.com'
-        soup = make_request(base_url + '/economia/')
+        soup = make_request(base_url + '/economia/', stop_after=LISTING_END_MARKERS.get('Exame Economy'))
         if soup:
             news_items = soup.select('article.article-card')
-            exame_articles = []
             for item in news_items[:10]:
                 title_elem = item.select_one('h2.article-card__title')
                 if title_elem and title_elem.a:
@@ -335,24 +531,25 @@ def fetch_economy() -> pd.DataFrame:
                             'title': title,
                             'link': link,
                             'source': 'Exame Economy',
-                            'category': 'Economy'
+                            'category': 'Economy',
+                            'published_at': extract_published_at(item)
                         })
-            articles.extend(exame_articles)
             logger.info(f"Encontradas {len(exame_articles)} notícias da Exame Economy")
     except Exception as e:
         logger.error(f"Erro ao buscar notícias da Exame Economy: {str(e)}")
 
-    return create_dataframe(articles)
+    return merge_sources({'CNN Brazil Economy': cnn_articles, 'Exame Economy': exame_articles})
 
 def fetch_crypto() -> pd.DataFrame:
     """Busca notícias de criptomoedas do Livecoins e Cointelegraph Brazil."""
-    articles = []
+    livecoins_articles = []
+    cointelegraph_articles = []
 
     # Livecoins
     try:
         logger.info("Buscando notícias do Livecoins...")
         base_url = 'https://livecoins.com.br'
-        soup = make_request(base_url + '/ultimas-noticias/')
+        soup = make_request(base_url + '/ultimas-noticias/', stop_after=LISTING_END_MARKERS.get('Livecoins'))
         if soup:
             news_items = soup.select('article.jeg_post')
             for item in news_items[:10]:
@@ -362,13 +559,14 @@ def fetch_crypto() -> pd.DataFrame:
                     link = title_elem.a['href']
 
                     if validate_article(title, link, base_url):
-                        articles.append({
+                        livecoins_articles.append({
                             'title': title,
                             'link': link,
                             'source': 'Livecoins',
-                            'category': 'Cryptocurrency'
+                            'category': 'Cryptocurrency',
+                            'published_at': extract_published_at(item)
                         })
-            logger.info(f"Encontradas {len(articles)} notícias do Livecoins")
+            logger.info(f"Encontradas {len(livecoins_articles)} notícias do Livecoins")
     except Exception as e:
         logger.error(f"Erro ao buscar notícias do Livecoins: {str(e)}")
 
@@ -376,10 +574,9 @@ def fetch_crypto() -> pd.DataFrame:
     try:
         logger.info("Buscando notícias do Cointelegraph Brazil...")
         base_url = 'https://br.cointelegraph.com'
-        soup = make_request(base_url + '/news')
+        soup = make_request(base_url + '/news', stop_after=LISTING_END_MARKERS.get('Cointelegraph Brazil'))
         if soup:
             news_items = soup.select('article.post-card')
-            cointelegraph_articles = []
             for item in news_items[:10]:
                 title_elem = item.select_one('span.post-card__title')
                 if title_elem:
@@ -393,14 +590,14 @@ def fetch_crypto() -> pd.DataFrame:
                                 'title': title,
                                 'link': base_url + link,
                                 'source': 'Cointelegraph Brazil',
-                                'category': 'Cryptocurrency'
+                                'category': 'Cryptocurrency',
+                                'published_at': extract_published_at(item)
                             })
-            articles.extend(cointelegraph_articles)
             logger.info(f"Encontradas {len(cointelegraph_articles)} notícias do Cointelegraph Brazil")
     except Exception as e:
         logger.error(f"Erro ao buscar notícias do Cointelegraph Brazil: {str(e)}")
 
-    return create_dataframe(articles)
+    return merge_sources({'Livecoins': livecoins_articles, 'Cointelegraph Brazil': cointelegraph_articles})
 
 def fetch_test_g1() -> pd.DataFrame:
     """
@@ -418,6 +615,7 @@ def fetch_test_g1() -> pd.DataFrame:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
+            'Accept-Encoding': DEFAULT_HEADERS['Accept-Encoding'],
             'Connection': 'keep-alive',
         }
 
@@ -426,67 +624,68 @@ def fetch_test_g1() -> pd.DataFrame:
 
         try:
             logger.info("Fazendo requisição para G1...")
-            response = requests.get(base_url, headers=headers, timeout=20)
-            logger.info(f"Status da requisição: {response.status_code}")
+            status_code, body, encoding = stream_download(base_url, headers=headers, timeout=20)
+            logger.info(f"Status da requisição: {status_code}")
 
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                logger.info(f"HTML carregado com sucesso: {len(response.text)} bytes")
+            if status_code == 200:
+                soup = BeautifulSoup(body, 'lxml', from_encoding=encoding)
+                logger.info(f"HTML carregado com sucesso: {len(body)} bytes")
 
                 # Log para verificar se o título da página está correto
                 page_title = soup.title.text if soup.title else "Sem título"
                 logger.info(f"Título da página: {page_title}")
 
                 # Elementos onde normalmente ficam as manchetes no G1
-                selectors = [
+                news_areas = selector_stats.select_areas(soup, 'G1', 'area', [
                     '.feed-post-body',
                     '.bastian-feed-item',
                     '.bstn-item',
                     '.post'
-                ]
+                ])
 
                 total_found = 0
 
-                for selector in selectors:
-                    news_items = soup.select(selector)
+                for selector, news_items in news_areas:
                     logger.info(f"Seletor '{selector}': encontrados {len(news_items)} itens")
                     total_found += len(news_items)
 
-                    for item in news_items[:10]:  # Limitando a 10 itens por seletor
-                        # Tentando diferentes padrões comuns para títulos no G1
-                        title_candidates = [
-                            item.select_one('.feed-post-link'),
-                            item.select_one('.bstn-hl-title'),
-                            item.select_one('a.gui-card-content__title'),
-                            item.select_one('h2 a'),
-                            item.select_one('h3 a')
-                        ]
-
-                        title_elem = next((t for t in title_candidates if t is not None), None)
-
-                        if title_elem:
-                            title = title_elem.get_text(strip=True)
-
-                            # Buscando o link (pode estar no próprio elemento ou em um parent)
-                            if title_elem.name == 'a':
-                                link = title_elem.get('href', '')
-                            else:
-                                link_elem = title_elem.find_parent('a')
-                                link = link_elem.get('href', '') if link_elem else ''
-
-                            if title and link:
-                                logger.info(f"Artigo encontrado: '{title[:30]}...' - Link: {link[:50]}...")
-
-                                # Normalizando o link
-                                if not link.startswith(('http://', 'https://')):
-                                    link = base_url + link.lstrip('/')
-
-                                articles.append({
-                                    'title': title,
-                                    'link': link,
-                                    'source': 'G1',
-                                    'category': 'Test'
-                                })
+                # Limitando a 10 itens por seletor
+                items = [item for _, news_items in news_areas for item in news_items[:10]]
+
+                # Tentando diferentes padrões comuns para títulos no G1, do mais ao menos eficaz
+                title_matches = selector_stats.select_each(items, 'G1', 'title', [
+                    '.feed-post-link',
+                    '.bstn-hl-title',
+                    'a.gui-card-content__title',
+                    'h2 a',
+                    'h3 a'
+                ], accept=has_title_text)
+
+                for item, title_elem in title_matches:
+                    if title_elem:
+                        title = title_elem.get_text(strip=True)
+
+                        # Buscando o link (pode estar no próprio elemento ou em um parent)
+                        if title_elem.name == 'a':
+                            link = title_elem.get('href', '')
+                        else:
+                            link_elem = title_elem.find_parent('a')
+                            link = link_elem.get('href', '') if link_elem else ''
+
+                        if title and link:
+                            logger.info(f"Artigo encontrado: '{title[:30]}...' - Link: {link[:50]}...")
+
+                            # Normalizando o link
+                            if not link.startswith(('http://', 'https://')):
+                                link = base_url + link.lstrip('/')
+
+                            articles.append({
+                                'title': title,
+                                'link': link,
+                                'source': 'G1',
+                                'category': 'Test',
+                                'published_at': extract_published_at(item)
+                            })
 
                 logger.info(f"Total de elementos encontrados com todos os seletores: {total_found}")
 
@@ -496,6 +695,7 @@ def fetch_test_g1() -> pd.DataFrame:
 
                     # Procurando qualquer link que pareça uma notícia
                     all_links = soup.select('a[href*="/noticia/"]')
+                    selector_stats.record('G1', 'fallback', 'a[href*="/noticia/"]', bool(all_links))
                     logger.info(f"Encontrados {len(all_links)} links genéricos de notícias")
 
                     for link_elem in all_links[:15]:  # Limitando a 15 links
@@ -513,10 +713,11 @@ def fetch_test_g1() -> pd.DataFrame:
                                 'title': title,
                                 'link': link,
                                 'source': 'G1',
-                                'category': 'Test'
+                                'category': 'Test',
+                                'published_at': extract_published_at(link_elem.parent)
                             })
             else:
-                logger.error(f"Falha na requisição: status code {response.status_code}")
+                logger.error(f"Falha na requisição: status code {status_code}")
 
         except requests.exceptions.Timeout:
             logger.error("Timeout na requisição para o G1")
@@ -527,12 +728,15 @@ def fetch_test_g1() -> pd.DataFrame:
         logger.error(f"Erro não esperado ao buscar notícias do G1: {str(e)}")
         logger.exception("Detalhes do erro:")
 
+    selector_stats.record_yield('G1', len(articles))
+    selector_stats.save()
+
     # Removendo duplicatas pelo título
     if articles:
-        df = pd.DataFrame(articles)
+        df = create_dataframe(merge_by_freshness([articles]))
         df = df.drop_duplicates(subset=['title'])
         logger.info(f"Total de {len(df)} artigos únicos encontrados do G1")
         return df
     else:
         logger.warning("Nenhum artigo encontrado no G1")
-        return pd.DataFrame(columns=['title', 'link', 'source', 'category'])
+        return create_dataframe([])
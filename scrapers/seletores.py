@@ -0,0 +1,268 @@
+import json
+import logging
+import os
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from utils import file_lock, write_atomic
+
+logger = logging.getLogger(__name__)
+
+# Arquivo onde as estatísticas dos seletores são persistidas entre execuções
+STATS_PATH = os.path.join('data', 'seletores.json')
+
+# Falhas seguidas para um seletor ser considerado morto
+DEAD_AFTER = 20
+
+class SelectorStats:
+    """
+    Registra quais seletores CSS acertam em cada fonte.
+
+    Os seletores são tentados na ordem de preferência informada; a taxa de acerto
+    não muda a ordem. Os que falharam `dead_after` vezes seguidas deixam de ser
+    tentados (só voltam a ser usados se todos os outros falharem), então um seletor
+    que funcionava e quebrou com uma mudança de layout é pulado logo. Também acompanha quantos
+    artigos cada fonte rendeu para alertar quando uma fonte zera.
+    """
+
+    def __init__(self, path: str = STATS_PATH, dead_after: int = DEAD_AFTER):
+        self.path = path
+        self.dead_after = dead_after
+        self._lock = threading.Lock()
+        # Eventos registrados desde o último save, reaplicados sobre o arquivo
+        self._pending_counts = {}
+        self._pending_yields = {}
+        self._data = self._load()
+
+    def _load(self) -> Dict:
+        data = {'selectors': {}, 'yields': {}}
+        if not os.path.exists(self.path):
+            return data
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                stored = json.load(f)
+            data['selectors'] = stored.get('selectors', {})
+            data['yields'] = stored.get('yields', {})
+            # Arquivos antigos não têm a sequência de falhas
+            for groups in data['selectors'].values():
+                for selectors in groups.values():
+                    for counts in selectors.values():
+                        counts.setdefault('streak', counts['misses'] if counts['hits'] == 0 else 0)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Não foi possível ler as estatísticas de seletores: {str(e)}")
+        return data
+
+    def save(self) -> None:
+        """
+        Grava as estatísticas no disco.
+
+        O dashboard e o crawler gravam o mesmo arquivo: sob uma trava de arquivo,
+        relê a versão atual e reaplica sobre ela apenas os eventos registrados
+        por este processo desde o último save, sem sobrescrever os dos outros.
+        """
+        with self._lock:
+            pending_counts, self._pending_counts = self._pending_counts, {}
+            pending_yields, self._pending_yields = self._pending_yields, {}
+
+        try:
+            with file_lock(self.path):
+                data = self._load()
+                for (source, group, selector), delta in pending_counts.items():
+                    self._merge_counts(self._counts_in(data, source, group, selector), delta)
+                for source, counts in pending_yields.items():
+                    for count in counts:
+                        self._apply_yield(data['yields'], source, count)
+                write_atomic(self.path, json.dumps(data, ensure_ascii=False, indent=2))
+        except OSError as e:
+            logger.warning(f"Não foi possível gravar as estatísticas de seletores: {str(e)}")
+            # Os eventos voltam para a fila e entram no próximo save
+            with self._lock:
+                for key, newer in self._pending_counts.items():
+                    self._merge_counts(pending_counts.setdefault(key, self._empty_counts()), newer)
+                self._pending_counts = pending_counts
+                for source, counts in pending_yields.items():
+                    self._pending_yields[source] = counts + self._pending_yields.get(source, [])
+            return
+
+        with self._lock:
+            # Parte do arquivo relido e reaplica o que foi registrado durante a gravação
+            for (source, group, selector), delta in self._pending_counts.items():
+                self._merge_counts(self._counts_in(data, source, group, selector), delta)
+            for source, counts in self._pending_yields.items():
+                for count in counts:
+                    self._apply_yield(data['yields'], source, count)
+            self._data = data
+
+    @staticmethod
+    def _empty_counts() -> Dict:
+        return {'hits': 0, 'misses': 0, 'streak': 0}
+
+    @classmethod
+    def _counts_in(cls, data: Dict, source: str, group: str, selector: str) -> Dict:
+        groups = data['selectors'].setdefault(source, {})
+        return groups.setdefault(group, {}).setdefault(selector, cls._empty_counts())
+
+    @staticmethod
+    def _merge_counts(counts: Dict, later: Dict) -> None:
+        """Acrescenta a `counts` os eventos posteriores resumidos em `later`."""
+        counts['hits'] += later['hits']
+        counts['misses'] += later['misses']
+        # Um acerto posterior zera a sequência; senão as falhas seguidas se somam
+        counts['streak'] = later['streak'] if later['hits'] else counts['streak'] + later['streak']
+
+    @staticmethod
+    def _apply_yield(yields: Dict, source: str, count: int) -> Dict:
+        entry = yields.setdefault(source, {'runs': 0, 'zero_streak': 0, 'last': 0})
+        entry['runs'] += 1
+        entry['last'] = count
+        entry['zero_streak'] = entry['zero_streak'] + 1 if count == 0 else 0
+        return entry
+
+    def record(self, source: str, group: str, selector: str, hit: bool) -> None:
+        """Registra um acerto ou uma falha de um seletor."""
+        event = {'hits': 1, 'misses': 0, 'streak': 0} if hit else {'hits': 0, 'misses': 1, 'streak': 1}
+        with self._lock:
+            self._merge_counts(self._counts_in(self._data, source, group, selector), event)
+            pending = self._pending_counts.setdefault((source, group, selector), self._empty_counts())
+            self._merge_counts(pending, event)
+
+    def hit_rate(self, source: str, group: str, selector: str) -> float:
+        """Taxa de acerto com suavização (seletores novos começam em 0.5)."""
+        counts = self._data['selectors'].get(source, {}).get(group, {}).get(selector)
+        if not counts:
+            return 0.5
+        return (counts['hits'] + 1) / (counts['hits'] + counts['misses'] + 2)
+
+    def is_dead(self, source: str, group: str, selector: str) -> bool:
+        """Indica se o seletor falhou nas últimas `dead_after` tentativas seguidas."""
+        counts = self._data['selectors'].get(source, {}).get(group, {}).get(selector)
+        return bool(counts) and counts['streak'] >= self.dead_after
+
+    def ordered(self, source: str, group: str, selectors: List[str]) -> List[str]:
+        """
+        Separa os seletores mortos, mantendo a ordem de preferência.
+
+        A ordem nunca muda pela taxa de acerto: um seletor genérico que acerta mais
+        vezes não pode passar à frente de um mais específico.
+
+        Returns:
+            List[str]: Seletores vivos seguidos dos mortos, cada grupo na ordem original
+        """
+        with self._lock:
+            live = [s for s in selectors if not self.is_dead(source, group, s)]
+            dead = [s for s in selectors if self.is_dead(source, group, s)]
+        return live + dead
+
+    def _first_match(self, element, source: str, group: str, selectors: List[str], accept: Optional[Callable]):
+        for selector in selectors:
+            result = element.select_one(selector)
+            usable = result is not None and (accept is None or accept(result))
+            self.record(source, group, selector, usable)
+            if usable:
+                return result
+        return None
+
+    def select_each(
+        self,
+        elements: List,
+        source: str,
+        group: str,
+        selectors: List[str],
+        accept: Optional[Callable] = None
+    ) -> List[Tuple]:
+        """
+        Busca, em cada elemento, o primeiro resultado utilizável entre os seletores.
+
+        Como em select_areas, os seletores mortos só são executados quando nenhum
+        vivo encontrou resultado em nenhum dos elementos da página.
+
+        Args:
+            elements (List): Elementos BeautifulSoup da página (ex.: itens das áreas)
+            source (str): Nome da fonte
+            group (str): Nome do grupo de seletores (ex.: 'title')
+            selectors (List[str]): Seletores candidatos, em ordem de preferência
+            accept (Callable): Valida um resultado; se recusado (ex.: título vazio de
+                um link de imagem), conta como falha e o próximo seletor é tentado
+
+        Returns:
+            List[Tuple]: Pares (elemento, resultado ou None), na ordem dos elementos
+        """
+        ordered = self.ordered(source, group, selectors)
+        live = [s for s in ordered if not self.is_dead(source, group, s)]
+        dead = ordered[len(live):]
+
+        results = [(element, self._first_match(element, source, group, live, accept)) for element in elements]
+
+        if dead and not any(result is not None for _, result in results):
+            results = [(element, self._first_match(element, source, group, dead, accept)) for element in elements]
+
+        return results
+
+    def select_areas(self, soup, source: str, group: str, selectors: List[str]) -> List[Tuple[str, List]]:
+        """
+        Executa os seletores de áreas da página, pulando os mortos.
+
+        Os seletores mortos só são executados quando nenhum vivo encontra itens,
+        para que uma mudança de layout que os reative seja percebida.
+
+        Returns:
+            List[Tuple[str, List]]: Pares (seletor, itens encontrados), na ordem de preferência
+        """
+        ordered = self.ordered(source, group, selectors)
+        live = [s for s in ordered if not self.is_dead(source, group, s)]
+        dead = ordered[len(live):]
+
+        areas = []
+        for selector in live:
+            items = soup.select(selector)
+            self.record(source, group, selector, bool(items))
+            areas.append((selector, items))
+
+        if not any(items for _, items in areas):
+            for selector in dead:
+                items = soup.select(selector)
+                self.record(source, group, selector, bool(items))
+                areas.append((selector, items))
+
+        return areas
+
+    def record_yield(self, source: str, count: int) -> None:
+        """Registra quantos artigos uma fonte rendeu e alerta quando zera."""
+        with self._lock:
+            yields = dict(self._apply_yield(self._data['yields'], source, count))
+            self._pending_yields.setdefault(source, []).append(count)
+
+        if count == 0:
+            logger.warning(
+                f"ALERTA: a fonte {source} não rendeu nenhum artigo "
+                f"({yields['zero_streak']} execução(ões) seguidas). O layout pode ter mudado."
+            )
+
+    def zero_yield_sources(self) -> List[str]:
+        """Fontes cuja última execução não rendeu nenhum artigo."""
+        with self._lock:
+            return sorted(s for s, y in self._data['yields'].items() if y['zero_streak'] > 0)
+
+    def report(self, source: Optional[str] = None) -> List[Dict]:
+        """Resumo das taxas de acerto, para exibição no dashboard."""
+        rows = []
+        with self._lock:
+            for src, groups in self._data['selectors'].items():
+                if source and src != source:
+                    continue
+                for group, selectors in groups.items():
+                    for selector, counts in selectors.items():
+                        rows.append({
+                            'source': src,
+                            'group': group,
+                            'selector': selector,
+                            'hits': counts['hits'],
+                            'misses': counts['misses'],
+                            'streak': counts['streak'],
+                            'hit_rate': self.hit_rate(src, group, selector),
+                            'dead': self.is_dead(src, group, selector)
+                        })
+        return rows
+
+# Instância compartilhada pelos scrapers
+selector_stats = SelectorStats()
@@ -0,0 +1,266 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import unicodedata
+from collections import OrderedDict, defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from utils import file_lock, write_atomic
+
+logger = logging.getLogger(__name__)
+
+# Arquivo onde os agregados do arquivo de notícias são persistidos
+STATS_PATH = os.path.join('data', 'tendencias.json')
+
+# Buckets de uma hora mantidos (30 dias)
+RETENTION_HOURS = 24 * 30
+
+# Termos acompanhados por hora no contador Space-Saving
+TERMS_PER_HOUR = 100
+
+# Links recentes lembrados para não contar o mesmo artigo duas vezes
+SEEN_CAPACITY = 50000
+
+STOPWORDS = set("""
+a à ao aos as às até após com como contra da das de dela dele deles do dos e é em entre era essa esse
+esta está estão este eu foi for foram há isso isto já la lá lhe mais mas me mesmo meu minha muito na
+nas nem no nos nós o os ou para pela pelas pelo pelos por qual quando que quem se sem ser será seu sua
+são só também te tem têm ter um uma umas uns vai vão você diz sobre novo nova novos novas pode podem
+ano anos dia dias hoje agora veja saiba entenda onde porque ainda cada
+the of and to in for on with from at by is are be as its it new how why what after over into
+""".split())
+
+TOKEN_PATTERN = re.compile(r"[^\W\d_][\w'-]*", re.UNICODE)
+
+def _strip_accents(text: str) -> str:
+    return ''.join(c for c in unicodedata.normalize('NFD', text) if unicodedata.category(c) != 'Mn')
+
+_STOPWORDS_NORMALIZED = {_strip_accents(word) for word in STOPWORDS}
+
+def extract_terms(title: str) -> List[str]:
+    """
+    Extrai unigramas e bigramas de um título, sem stopwords.
+
+    Args:
+        title (str): Título da notícia
+
+    Returns:
+        List[str]: Termos (bigramas apenas entre palavras vizinhas que não são stopwords)
+    """
+    tokens = [token.lower().strip("'-") for token in TOKEN_PATTERN.findall(title or "")]
+    keep = [len(t) > 2 and _strip_accents(t) not in _STOPWORDS_NORMALIZED for t in tokens]
+
+    terms = [t for t, k in zip(tokens, keep) if k]
+    terms += [
+        f"{tokens[i]} {tokens[i + 1]}"
+        for i in range(len(tokens) - 1)
+        if keep[i] and keep[i + 1]
+    ]
+    return terms
+
+def _space_saving_add(counters: Dict[str, int], term: str, capacity: int) -> None:
+    """
+    Adiciona um termo a um contador Space-Saving de capacidade fixa.
+
+    Quando o contador está cheio, o termo menos frequente é substituído e o novo
+    herda sua contagem (superestimando-o no máximo por esse valor).
+    """
+    if term in counters:
+        counters[term] += 1
+    elif len(counters) < capacity:
+        counters[term] = 1
+    else:
+        weakest = min(counters, key=counters.get)
+        counters[term] = counters.pop(weakest) + 1
+
+def _bucket(moment: datetime) -> str:
+    return moment.astimezone(timezone.utc).strftime('%Y-%m-%dT%H')
+
+class TrendStats:
+    """
+    Agregados incrementais sobre o arquivo de notícias.
+
+    Cada artigo novo atualiza, no bucket da hora em que foi publicado, a contagem
+    por fonte, por categoria e um contador Space-Saving dos termos dos títulos.
+    As consultas somam os buckets da janela pedida, sem reler os artigos.
+    """
+
+    def __init__(self, path: str = STATS_PATH, retention_hours: int = RETENTION_HOURS):
+        self.path = path
+        self.retention_hours = retention_hours
+        self._lock = threading.Lock()
+        # Artigos contabilizados desde o último save, reaplicados sobre o arquivo
+        self._pending = []
+        self._buckets, self._seen = self._load()
+
+    def _load(self):
+        buckets, seen = {}, OrderedDict()
+        if not os.path.exists(self.path):
+            return buckets, seen
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+            buckets = data.get('buckets', {})
+            seen = OrderedDict.fromkeys(data.get('seen', []))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Não foi possível ler as tendências: {str(e)}")
+        return buckets, seen
+
+    def save(self) -> None:
+        """
+        Grava os agregados no disco.
+
+        O dashboard e o crawler gravam o mesmo arquivo: sob uma trava de arquivo,
+        relê a versão atual e reaplica sobre ela os artigos contabilizados por
+        este processo desde o último save (os já vistos pelo outro são ignorados).
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+
+        oldest = self._oldest(datetime.now(timezone.utc))
+        try:
+            with file_lock(self.path):
+                buckets, seen = self._load()
+                for entry in pending:
+                    self._apply(buckets, seen, entry)
+                self._prune(buckets, oldest)
+                write_atomic(self.path, json.dumps({'buckets': buckets, 'seen': list(seen)}, ensure_ascii=False))
+        except OSError as e:
+            logger.warning(f"Não foi possível gravar as tendências: {str(e)}")
+            # Os artigos voltam para a fila e entram no próximo save
+            with self._lock:
+                self._pending = pending + self._pending
+            return
+
+        with self._lock:
+            # Parte do arquivo relido e reaplica o que foi contabilizado durante a gravação
+            for entry in self._pending:
+                self._apply(buckets, seen, entry)
+            self._buckets, self._seen = buckets, seen
+
+    def _oldest(self, now: datetime) -> str:
+        return _bucket(now - timedelta(hours=self.retention_hours))
+
+    @staticmethod
+    def _prune(buckets: Dict, oldest: str) -> None:
+        for bucket_key in [k for k in buckets if k < oldest]:
+            del buckets[bucket_key]
+
+    @staticmethod
+    def _apply(buckets: Dict, seen: OrderedDict, entry: tuple) -> bool:
+        """Contabiliza um artigo (chave, bucket, fonte, categoria, título) se ainda não foi visto."""
+        key, bucket_key, source, category, title = entry
+        if key in seen:
+            return False
+        seen[key] = None
+        if len(seen) > SEEN_CAPACITY:
+            seen.popitem(last=False)
+        if bucket_key is None:
+            return False
+
+        bucket = buckets.setdefault(bucket_key, {'sources': {}, 'categories': {}, 'terms': {}})
+        bucket['sources'][source] = bucket['sources'].get(source, 0) + 1
+        bucket['categories'][category] = bucket['categories'].get(category, 0) + 1
+        for term in extract_terms(title):
+            _space_saving_add(bucket['terms'], term, TERMS_PER_HOUR)
+        return True
+
+    def ingest(self, articles: Iterable[Dict], now: Optional[datetime] = None) -> int:
+        """
+        Atualiza os agregados com os artigos de uma busca.
+
+        Artigos já vistos são ignorados; artigos sem data entram na hora atual.
+
+        Args:
+            articles: Artigos com 'title', 'link', 'source', 'category' e 'published_at'
+            now (datetime): Horário de referência (padrão: agora)
+
+        Returns:
+            int: Número de artigos novos contabilizados
+        """
+        now = now or datetime.now(timezone.utc)
+        oldest = self._oldest(now)
+        added = 0
+
+        with self._lock:
+            for article in articles:
+                key = hashlib.sha1(str(article.get('link', '')).encode('utf-8')).hexdigest()[:16]
+                if key in self._seen:
+                    continue
+
+                published_at = article.get('published_at')
+                if published_at is None or published_at != published_at:  # None ou NaT
+                    published_at = now
+                bucket_key = _bucket(min(published_at, now))
+                if bucket_key < oldest:
+                    bucket_key = None  # só marca como visto
+
+                entry = (key, bucket_key, article.get('source', ''), article.get('category', ''), article.get('title', ''))
+                self._pending.append(entry)
+                if self._apply(self._buckets, self._seen, entry):
+                    added += 1
+
+            self._prune(self._buckets, oldest)
+
+        logger.info(f"Tendências atualizadas com {added} artigos novos")
+        return added
+
+    def ingest_dataframe(self, df: pd.DataFrame) -> int:
+        """Atalho para ingest a partir do DataFrame retornado pelos scrapers."""
+        if df.empty:
+            return 0
+        return self.ingest(df.to_dict('records'))
+
+    def _totals(self, field: str, hours: int) -> Dict[str, int]:
+        """Soma um campo dos buckets da janela (somado sob a trava, pois ingest altera os buckets)."""
+        start = _bucket(datetime.now(timezone.utc) - timedelta(hours=hours - 1))
+        totals = defaultdict(int)
+        with self._lock:
+            for key, bucket in self._buckets.items():
+                if key >= start:
+                    for name, count in bucket[field].items():
+                        totals[name] += count
+        return totals
+
+    def source_rates(self, hours: int = 24) -> pd.DataFrame:
+        """Artigos por fonte na janela, e a taxa média por hora."""
+        totals = self._totals('sources', hours)
+        df = pd.DataFrame(
+            [{'fonte': source, 'artigos': count, 'por hora': count / hours} for source, count in totals.items()],
+            columns=['fonte', 'artigos', 'por hora']
+        )
+        return df.sort_values('artigos', ascending=False).round(2)
+
+    def category_volume(self, hours: int = 24) -> pd.DataFrame:
+        """Volume por categoria ao longo do tempo (uma linha por bucket de hora, ou dia para janelas longas)."""
+        now = datetime.now(timezone.utc)
+        start = _bucket(now - timedelta(hours=hours - 1))
+        with self._lock:
+            rows = [
+                {'hora': key, 'categoria': category, 'artigos': count}
+                for key, bucket in self._buckets.items() if key >= start
+                for category, count in bucket['categories'].items()
+            ]
+        if not rows:
+            return pd.DataFrame()
+
+        df = pd.DataFrame(rows)
+        df['hora'] = pd.to_datetime(df['hora'], format='%Y-%m-%dT%H', utc=True)
+        if hours > 72:
+            df['hora'] = df['hora'].dt.floor('D')
+        return df.pivot_table(index='hora', columns='categoria', values='artigos', aggfunc='sum', fill_value=0)
+
+    def top_terms(self, hours: int = 24, limit: int = 15) -> pd.DataFrame:
+        """Termos mais frequentes nos títulos da janela (contagens aproximadas)."""
+        totals = self._totals('terms', hours)
+        top = sorted(totals.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return pd.DataFrame(top, columns=['termo', 'ocorrências'])
+
+# Instância compartilhada pelo dashboard e pelo crawler
+trend_stats = TrendStats()
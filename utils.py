@@ -1,3 +1,16 @@
+import os
+import re
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem trava entre processos
+    fcntl = None
+
 def format_link(title: str, url: str) -> str:
     """
     Formata um título e URL em uma string de link HTML.
@@ -50,3 +63,126 @@ def safe_extract(element, selector, attr=None):
             return result.get_text(strip=True)
     except:
         return ""
+
+# Fuso usado para datas sem informação de fuso (horário de Brasília, sem horário de verão)
+BRT = timezone(timedelta(hours=-3))
+
+_RELATIVE_TIME = re.compile(r'h[áa]\s+(\d+)\s*(minuto|min|hora|h|dia|semana)s?\b', re.IGNORECASE)
+_RELATIVE_UNITS = {
+    'minuto': 'minutes', 'min': 'minutes',
+    'hora': 'hours', 'h': 'hours',
+    'dia': 'days',
+    'semana': 'weeks'
+}
+
+def parse_datetime(value, now: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    Converte uma data de publicação em datetime com fuso horário.
+
+    Aceita ISO 8601 (atributos datetime e meta tags), datas RFC 822 de feeds
+    RSS (pubDate) e expressões relativas como "Há 2 horas".
+
+    Args:
+        value: Texto ou datetime a ser convertido
+        now (datetime): Referência para datas relativas (padrão: agora)
+
+    Returns:
+        datetime: Data em UTC, ou None se não for possível interpretar
+    """
+    if not value:
+        return None
+
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        text = str(value).strip()
+        relative = _RELATIVE_TIME.search(text)
+        if relative:
+            amount, unit = relative.groups()
+            now = now or datetime.now(timezone.utc)
+            delta = timedelta(**{_RELATIVE_UNITS[unit.lower()]: int(amount)})
+            return (now - delta).astimezone(timezone.utc)
+
+        try:
+            parsed = datetime.fromisoformat(text.replace('Z', '+00:00'))
+        except ValueError:
+            try:
+                parsed = parsedate_to_datetime(text)
+            except (TypeError, ValueError, IndexError):
+                return None
+            if parsed is None:
+                return None
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=BRT)
+    return parsed.astimezone(timezone.utc)
+
+def format_published_at(value) -> str:
+    """
+    Formata a data de publicação no horário de Brasília.
+
+    Args:
+        value: datetime ou Timestamp (NaT/None são aceitos)
+
+    Returns:
+        str: Data no formato "dd/mm/aaaa HH:MM", ou string vazia se ausente
+    """
+    if value is None or value != value:  # None ou NaT
+        return ""
+    return value.astimezone(BRT).strftime("%d/%m/%Y %H:%M")
+
+def truncate_series(texts, limit: int = 100):
+    """
+    Versão vetorizada de truncate_text para uma coluna inteira do pandas.
+
+    Args:
+        texts (pd.Series): Textos a serem truncados
+        limit (int): Comprimento máximo antes da truncagem
+
+    Returns:
+        pd.Series: Textos truncados com reticências se necessário
+    """
+    texts = texts.fillna("").astype(str)
+    return texts.where(texts.str.len() <= limit, texts.str.slice(0, limit - 3) + "...")
+
+@contextmanager
+def file_lock(path: str):
+    """
+    Trava exclusiva entre processos sobre um arquivo (usa `<path>.lock`).
+
+    Serializa o ciclo ler-mesclar-gravar dos arquivos compartilhados entre o
+    dashboard e o crawler. Em sistemas sem fcntl, não trava.
+
+    Args:
+        path (str): Arquivo protegido pela trava
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(f"{path}.lock", 'a') as lock:
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+def write_atomic(path: str, text: str) -> None:
+    """
+    Grava um arquivo de texto de forma atômica.
+
+    O conteúdo vai para um arquivo temporário único no mesmo diretório, que então
+    substitui o destino; gravações simultâneas nunca se intercalam.
+
+    Args:
+        path (str): Arquivo de destino
+        text (str): Conteúdo a gravar
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directory, suffix='.tmp', delete=False) as f:
+        f.write(text)
+    try:
+        os.replace(f.name, path)
+    except OSError:
+        os.unlink(f.name)
+        raise